@@ -4,3 +4,5 @@ class RunParameters:
         self.maxIterations = 10000000 #(dimensions * dimensions) * 50
         self.dimensions = dimensions
         self.bounds = bounds
+        self.seed = None
+        self.restrict_symmetry = False
@@ -1,4 +1,9 @@
 
+import heapq
+
+from Framework.DemeControllers.DemePopulation import DemePopulation
+from Framework.DemeControllers.DemeSlot import DemeSlot
+
 
 class DemeController:
 
@@ -8,62 +13,149 @@ class DemeController:
         self.bestLocation = locationBuildController.build(build_params)
         self.location_store = location_store
         self.locationBuildController = locationBuildController
-        self.members = []
         self.member_pairs = []
+        self.bestSlot = None
+        self.member_pool = {}
+        self.pooled_members = 0
+        self.population = DemePopulation(parameters.dimensions, self.get_capacity())
+        self.skipped_evaluations = 0
+
+    def get_capacity(self):
+        tournament_size = self.parameters.tournament_size
+        build_size = self.parameters.deme_size + (self.parameters.deme_size % tournament_size)
+        return -(-build_size // tournament_size) * tournament_size
+
+    @property
+    def members(self):
+        return self.population.occupants()
 
     def initialise(self):
-        self.members = self.initialise_members()
+        self.initialise_members()
 
     def initialise_members(self):
         memberBuilder = self.get_memberBuilder()
-        memberList = []
         diff = self.parameters.deme_size % self.parameters.tournament_size
         build_size = self.parameters.deme_size + diff
 
         for item in range(0, build_size, self.parameters.tournament_size):
             demeLocation = self.bestLocation if len(self.bestLocation) > 0 else self.selectNewLocation()
-            tournament = [memberBuilder.build(demeLocation, self.location_store) for x in range(0, self.parameters.tournament_size)]
+            tournament = [self.build_member(memberBuilder, demeLocation).slot for x in range(0, self.parameters.tournament_size)]
             self.member_pairs.append(tournament)
-            for item in tournament:
-                memberList.append(item)
-
-        return memberList
 
     def update(self):
-        for pair in self.member_pairs:
-            ordered = sorted(pair, key=lambda x: x.bestPerformance)
-            best_member = ordered[0]
-            length = len(ordered)
-            start = length - self.parameters.prune_size
-
-            for index in range(start, length):
-                remove_item = ordered[index]
-                pair.remove(remove_item)
-                self.members.remove(remove_item)
-                member_builder = self.get_memberBuilder()
-                new_member = member_builder.build(best_member.bestLocation, self.location_store)
-                self.members.append(new_member)
-                pair.append(new_member)
-
-            best_member.update()
+        for tournament in self.member_pairs:
+            best, worst = self.rank_tournament(tournament)
+            best_member = self.population.members[tournament[best]]
+            # a list copy outlives a rebuild of the best slot and gives the new members plain ints to work on
+            best_location = self.population.best_boards[tournament[best]].tolist()
+
+            for index in worst:
+                self.build_member(self.get_memberBuilder(), best_location, tournament[index])
+
+            if best not in worst:
+                best_member.update()
+
+    def rank_tournament(self, tournament):
+        # positions break ties so the earliest of equal members wins and the latest are pruned first
+        best_fitness = self.population.best_fitness
+        ranked = sorted(range(0, len(tournament)), key=lambda index: (best_fitness[tournament[index]], index))
+        return ranked[0], ranked[:-self.parameters.prune_size - 1:-1]
+
+    def build_member(self, memberBuilder, location, slot=None):
+        population = self.population
+        if slot is None:
+            slot = population.reserve()
+        else:
+            self.release_best(slot)
+            self.recycle_member(population.members[slot])
+
+        # the member is bound to the slot before it initialises so it writes straight into the deme arrays
+        recycled = self.take_pooled_member(memberBuilder)
+        if recycled is None:
+            recycled = DemeSlot(population, slot)
+        else:
+            population.bind(slot, recycled)
+
+        member = memberBuilder.build(location, self.location_store, recycled)
+        member.memberFactory = memberBuilder
+        return member
+
+    def recycle_member(self, member):
+        if member is None or member.memberFactory is None or self.pooled_members >= self.population.capacity:
+            return
+
+        member.boardState = None
+        self.member_pool.setdefault(type(member.memberFactory), []).append(member)
+        self.pooled_members += 1
+
+    def take_pooled_member(self, memberBuilder):
+        pool = self.member_pool.get(type(memberBuilder))
+        if not pool:
+            return None
+
+        self.pooled_members -= 1
+        return pool.pop()
 
     def execute_evaluations(self, items, evaluator):
         for member in items:
             member.evaluate(evaluator)
 
     def evaluate(self, evaluator):
-        self.execute_evaluations(self.members, evaluator)
-
-        bestMember = self.calculateBestMember()
-        if bestMember is not None:
-            self.bestFitness = bestMember.get_BestFitness()
-            self.bestLocation = bestMember.bestLocation
-
-    def calculateBestMember(self):
-        if len(self.members) == 0:
+        members = self.members
+        changed = [member for member in members if member.dirty]
+        self.skipped_evaluations += len(members) - len(changed)
+        self.execute_evaluations(changed, evaluator)
+        self.track_best([member.slot for member in changed])
+
+    def track_best(self, slots):
+        if self.bestSlot is None:
+            slots = self.population.occupied_slots()
+        if len(slots) == 0:
+            return
+
+        # only the evaluated slots can have overtaken the tracked best, ties go to the lowest slot
+        best_fitness = self.population.best_fitness
+        candidate = min(slots, key=lambda slot: (best_fitness[slot], slot))
+        if self.bestSlot is None \
+                or (best_fitness[candidate], candidate) < (best_fitness[self.bestSlot], self.bestSlot):
+            self.bestSlot = candidate
+        elif self.bestSlot not in slots:
+            return
+
+        self.bestFitness = self.population.best_fitness[self.bestSlot]
+        self.bestLocation = self.population.best_boards[self.bestSlot].tolist()
+
+    def release_best(self, slot):
+        if slot == self.bestSlot:
+            self.bestSlot = None
+
+    def get_bestMember(self):
+        if self.bestSlot is None:
             return None
-        sortedMembers = sorted(self.members, key=lambda k: k.get_BestFitness())
-        return sortedMembers[0]
+        return self.population.members[self.bestSlot]
+
+    def get_eliteLocations(self, count):
+        # a solved best is already in the result store, sending it on would only have the next deme find it again
+        best_fitness = self.population.best_fitness
+        unsolved = [slot for slot in self.population.occupied_slots() if best_fitness[slot] > 0]
+        elite = heapq.nsmallest(count, unsolved, key=best_fitness.__getitem__)
+        if len(elite) == 0:
+            return []
+
+        return self.population.best_boards[elite].tolist()
+
+    def get_worstTournamentSlots(self, count):
+        # the worst member of each of the weakest tournaments, so a better migrant leads that tournament's rebuilds
+        best_fitness = self.population.best_fitness
+        tournaments = sorted(self.member_pairs, reverse=True,
+                             key=lambda tournament: min(best_fitness[slot] for slot in tournament))
+        return [max(tournament, key=best_fitness.__getitem__) for tournament in tournaments[:count]]
+
+    def receive_migrants(self, locations):
+        # migrants replace the locations of the worst members unchanged, they are evaluated again on arrival
+        for slot, location in zip(self.get_worstTournamentSlots(len(locations)), locations):
+            self.release_best(slot)
+            self.population.members[slot].assignLocation(location)
 
     def selectNewLocation(self):
         return self.locationBuildController.build()
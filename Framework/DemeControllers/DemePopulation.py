@@ -0,0 +1,104 @@
+import numpy
+
+
+class DemePopulation:
+
+    def __init__(self, dimensions, capacity):
+        self.dimensions = dimensions
+        self.capacity = capacity
+        board_type = self.board_type(dimensions)
+        self.boards = numpy.zeros((capacity, dimensions), dtype=board_type)
+        self.best_boards = numpy.zeros((capacity, dimensions), dtype=board_type)
+        # the scalars are read and written once per member and evaluation, which plain lists do faster than arrays
+        self.fitness = [9999999999] * capacity
+        self.best_fitness = [9999999999] * capacity
+        self.ages = [0] * capacity
+        self.members = [None] * capacity
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+    @staticmethod
+    def board_type(dimensions):
+        return numpy.int16 if dimensions < 32768 else numpy.int32
+
+    def __len__(self):
+        return self.capacity - len(self.free_slots)
+
+    def grow(self):
+        capacity = self.capacity
+        self.boards = numpy.concatenate((self.boards, numpy.zeros_like(self.boards)))
+        self.best_boards = numpy.concatenate((self.best_boards, numpy.zeros_like(self.best_boards)))
+        self.fitness.extend([9999999999] * capacity)
+        self.best_fitness.extend([9999999999] * capacity)
+        self.ages.extend([0] * capacity)
+        self.members.extend([None] * capacity)
+        self.free_slots.extend(range((2 * capacity) - 1, capacity - 1, -1))
+        self.capacity = 2 * capacity
+
+    def insert(self, member):
+        slot = self.reserve()
+        self.place(slot, member)
+        return slot
+
+    def reserve(self):
+        if len(self.free_slots) == 0:
+            self.grow()
+
+        return self.free_slots.pop()
+
+    def replace(self, slot, member):
+        # the previous occupant is unbound without touching the free slots
+        self.place(slot, member)
+        return slot
+
+    def place(self, slot, member):
+        source = member.population
+        if source is not None:
+            # copy the member's row out of the population it was created in before rebinding it
+            self.boards[slot] = source.boards[member.slot]
+            self.best_boards[slot] = source.best_boards[member.slot]
+            self.fitness[slot] = source.fitness[member.slot]
+            self.best_fitness[slot] = source.best_fitness[member.slot]
+            self.ages[slot] = source.ages[member.slot]
+            source.release(member.slot)
+        else:
+            self.reset(slot)
+
+        self.bind(slot, member)
+
+    def bind(self, slot, member):
+        if self.members[slot] is not member:
+            self.unbind(slot)
+        self.members[slot] = member
+        member.population = self
+        member.slot = slot
+
+    def unbind(self, slot):
+        # a member that has left its slot must not keep writing into the rows of the next occupant
+        member = self.members[slot]
+        if member is not None:
+            member.population = None
+            member.slot = None
+        self.members[slot] = None
+
+    def reset(self, slot):
+        self.fitness[slot] = 9999999999
+        self.best_fitness[slot] = 9999999999
+        self.ages[slot] = 0
+
+    def release(self, slot):
+        # the row is left as it is, insert overwrites every field of a reused slot
+        self.unbind(slot)
+        self.free_slots.append(slot)
+
+    def occupied_slots(self):
+        return [slot for slot in range(0, self.capacity) if self.members[slot] is not None]
+
+    def occupants(self):
+        return [member for member in self.members if member is not None]
+
+    def memory_report(self):
+        array_bytes = self.boards.nbytes + self.best_boards.nbytes
+
+        return {'members': len(self),
+                'capacity': self.capacity,
+                'array_bytes': array_bytes}
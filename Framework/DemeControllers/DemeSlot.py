@@ -0,0 +1,7 @@
+class DemeSlot:
+
+    __slots__ = ('population', 'slot')
+
+    def __init__(self, population, slot):
+        self.population = population
+        self.slot = slot
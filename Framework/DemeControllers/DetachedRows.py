@@ -0,0 +1,25 @@
+import numpy
+
+from Framework.DemeControllers.DemePopulation import DemePopulation
+
+
+class DetachedRows:
+
+    # the rows of a member built outside a deme, laid out like slot 0 of a population without the slot bookkeeping
+    __slots__ = ('boards', 'best_boards', 'fitness', 'best_fitness', 'ages')
+
+    def __init__(self, dimensions):
+        board_type = DemePopulation.board_type(dimensions)
+        self.boards = numpy.zeros((1, dimensions), dtype=board_type)
+        self.best_boards = numpy.zeros((1, dimensions), dtype=board_type)
+        self.fitness = [9999999999]
+        self.best_fitness = [9999999999]
+        self.ages = [0]
+
+    def reset(self, slot):
+        self.fitness[slot] = 9999999999
+        self.best_fitness[slot] = 9999999999
+        self.ages[slot] = 0
+
+    def release(self, slot):
+        pass
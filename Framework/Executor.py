@@ -8,7 +8,7 @@ from NQueens.NQueensRunParameters import NQueensRunParameters
 class RunExecutor:
 
     def __init__(self):
-        self.evaluation = NQueensEvaluation()
+        self.evaluation = NQueensEvaluation(incremental=True)
         self.dimensions = 20
         self.bounds = [self.dimensions for x in range(0, self.dimensions)]
         self.parameters = NQueensRunParameters(self.dimensions, self.bounds, 1, 1, [], 2, 1, 7, False)
@@ -18,7 +18,7 @@ class RunExecutor:
     def execute_single(self):
         for run in range(0, 1):
             dimensions = 32
-            self.evaluation = NQueensEvaluation()
+            self.evaluation = NQueensEvaluation(incremental=True)
             self.bounds = [dimensions for x in range(0, dimensions)]
             bias = [60, 80, 95]
             import_dimensions = 16
@@ -33,7 +33,7 @@ class RunExecutor:
             previousSize = 0
             for iteration in range(0, self.parameters.maxIterations):
                 controller.update(self.evaluation)
-                currentSize = len(self.evaluation.resultStore)
+                currentSize = self.evaluation.total_solutions
                 if currentSize == previousSize:
                     timeSinceUpdate += 1
 
@@ -41,7 +41,7 @@ class RunExecutor:
                 if len(controller.demes) == 0:
                     break
                 #if timeSinceUpdate > 10000: # + (2000 * loop):
-                if len(self.evaluation.resultStore) >= 5000:
+                if self.evaluation.total_solutions >= 5000:
                     break
                 # if len(self.evaluation.resultStore) == 92:
             #      break
@@ -49,14 +49,21 @@ class RunExecutor:
             #        for value in self.evaluation.resultStore:
             #            print(value)
 
-            print(str(dimensions) + "======== " + str(len(self.evaluation.resultStore)) + "=======")
+            print(str(dimensions) + "======== " + str(self.evaluation.total_solutions) + "=======")
+            print("skipped evaluations: " + str(controller.get_skipped_evaluations()))
+            print("mutation strengths: " + str(controller.get_mutation_strength_statistics()))
+            print("operator credit: " + str(controller.get_operator_credit()))
+            print("migrations: " + str(controller.migrator.migrations))
+            print(self.evaluation.resultStore.memory_report())
+            print("population memory: " + str(controller.get_population_memory()))
+            self.evaluation.solution_sink.close()
 
             self.output_to_file("", run, False)
 
     def execute(self):
        # try:
         for loop in range(21, 2000):
-            self.evaluation = NQueensEvaluation()
+            self.evaluation = NQueensEvaluation(incremental=True)
             prune_age = 20 + (loop * 5)#self.prune_ages[loop % len(self.prune_ages)]
             mutation_count = 3#loop / 2#random.randint(0, 8)
             min_age = 56 + loop # 50 + random.randint(0, 40)
@@ -73,7 +80,7 @@ class RunExecutor:
             previousSize = 0
             for iteration in range(0, self.parameters.maxIterations):
                 controller.update(self.evaluation)
-                currentSize = len(self.evaluation.resultStore)
+                currentSize = self.evaluation.total_solutions
                 if currentSize == previousSize:
                     timeSinceUpdate += 1
 
@@ -82,13 +89,18 @@ class RunExecutor:
                     break
                 if timeSinceUpdate > 500 + (2000 * loop):
                     break
-                if len(self.evaluation.resultStore) > 40:
+                if self.evaluation.total_solutions > 40:
                     break
 
     #        for value in self.evaluation.resultStore:
     #            print(value)
 
-            print(str(loop) + "======== " + str(len(self.evaluation.resultStore)) + "=======")
+            print(str(loop) + "======== " + str(self.evaluation.total_solutions) + "=======")
+            print("skipped evaluations: " + str(controller.get_skipped_evaluations()))
+            print("mutation strengths: " + str(controller.get_mutation_strength_statistics()))
+            print("operator credit: " + str(controller.get_operator_credit()))
+            print("migrations: " + str(controller.migrator.migrations))
+            self.evaluation.solution_sink.close()
 
             self.output_to_file('', just_count=False)
 
@@ -96,10 +108,10 @@ class RunExecutor:
         filename = str(self.parameters.dimensions) + prefix + "output.txt" #+ "_" + str(run) + ".txt"
         f = open(filename, "w")
         if just_count:
-            f.write(str(len(self.evaluation.resultStore)) + " ===== " + str(self.evaluation.evaluations))
+            f.write(str(self.evaluation.total_solutions) + " ===== " + str(self.evaluation.fundamental_solutions) + " ===== " + str(self.evaluation.evaluations))
         else:
-            for value in self.evaluation.resultStore:
-                f.write(value)
+            for value in self.evaluation.all_solutions():
+                f.write(self.evaluation.createResultHash(value))
                 f.write("\r")
         f.close()
 
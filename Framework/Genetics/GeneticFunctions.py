@@ -1,4 +1,11 @@
 import random
+import zlib
+
+import numpy
+
+zobrist_tables = {}
+random_streams = {}
+random_seed = None
 
 
 def create_crossover(loc_one, loc_two):
@@ -7,42 +14,218 @@ def create_crossover(loc_one, loc_two):
     return result
 
 
-def perform_mutation(location):
-    swapPosition1 = random.randint(0, len(location) - 1)
+def select_cut_points(length):
+    first_cut = random.randint(0, length - 1)
+    last_cut = random.randint(first_cut + 1, length)
+    return first_cut, last_cut
+
+
+def create_pmx_crossover(loc_one, loc_two):
+    first_cut, last_cut = select_cut_points(len(loc_one))
+    result = [None for x in loc_one]
+    result[first_cut:last_cut] = loc_one[first_cut:last_cut]
+    copied = set(result[first_cut:last_cut])
+    positions = {loc_two[index]: index for index in range(0, len(loc_two))}
+
+    for index in range(first_cut, last_cut):
+        value = loc_two[index]
+        if value in copied:
+            continue
+
+        position = index
+        while first_cut <= position < last_cut:
+            position = positions[loc_one[position]]
+        result[position] = value
+
+    for index in range(0, len(result)):
+        if result[index] is None:
+            result[index] = loc_two[index]
+
+    return result
+
+
+def create_order_crossover(loc_one, loc_two):
+    first_cut, last_cut = select_cut_points(len(loc_one))
+    length = len(loc_one)
+    result = [None for x in loc_one]
+    result[first_cut:last_cut] = loc_one[first_cut:last_cut]
+    copied = set(result[first_cut:last_cut])
+
+    position = last_cut % length
+    for offset in range(0, length):
+        value = loc_two[(last_cut + offset) % length]
+        if value in copied:
+            continue
+
+        result[position] = value
+        position = (position + 1) % length
+
+    return result
+
+
+def create_cycle_crossover(loc_one, loc_two):
+    result = [None for x in loc_one]
+    positions = {loc_one[index]: index for index in range(0, len(loc_one))}
+    source = loc_one
+
+    for start in range(0, len(loc_one)):
+        if result[start] is not None:
+            continue
+
+        index = start
+        while result[index] is None:
+            result[index] = source[index]
+            index = positions[loc_two[index]]
+
+        source = loc_two if source is loc_one else loc_one
+
+    return result
+
+
+def select_swap_positions(length, conflicts=None):
+    swapPosition1 = random.choice(conflicts) if conflicts else random.randint(0, length - 1)
     swapPosition2 = swapPosition1;
     while (swapPosition1 == swapPosition2):
-        swapPosition2 = random.randint(0, len(location) - 1)
+        swapPosition2 = random.randint(0, length - 1)
 
-    first_swap = min(swapPosition1, swapPosition2)
-    last_swap = max(swapPosition1, swapPosition2)
-    first_val = location[first_swap]
-    last_val = location[last_swap]
-    start = location[:first_swap] if first_swap > 0 else []
-    mid = location[first_swap + 1: last_swap]
-    end = location[last_swap + 1:]
-    start.append(last_val)
-    start.extend(mid)
-    start.append(first_val)
-    start.extend(end)
-    #new_location = start + last_val + mid + first_val + end
+    return min(swapPosition1, swapPosition2), max(swapPosition1, swapPosition2)
 
-    return start
+
+def swap_positions(location, first_swap, last_swap):
+    return swap_positions_in_place(list(location), first_swap, last_swap)
+
+
+def swap_positions_in_place(location, first_swap, last_swap):
+    location[first_swap], location[last_swap] = location[last_swap], location[first_swap]
+    return location
+
+
+def perform_mutation(location):
+    first_swap, last_swap = select_swap_positions(len(location))
+    return swap_positions(location, first_swap, last_swap)
+
+
+def copy_location(location):
+    return location.tolist() if isinstance(location, numpy.ndarray) else list(location)
 
 
 def switch_positions(location, switches):
-    new_location = location
+    new_location = copy_location(location)
     for x in range(0, switches):
-        new_location = perform_mutation(new_location)
+        first_swap, last_swap = select_swap_positions(len(new_location))
+        swap_positions_in_place(new_location, first_swap, last_swap)
 
     return new_location
 
-def create_random_location(dimensions):
-    loc = []
-    selections = [x for x in range(0, dimensions - 1)]
-    for index in range(0, dimensions):
-        select = random.randint(0, len(selections) - 1)
-        item = selections[select]
-        selections = selections.remove(item)
-        loc.append(item)
 
-    return loc
\ No newline at end of file
+def switch_positions_tracked(location, switches, location_hash=0, conflicts=None, excluded=None):
+    new_location = copy_location(location)
+    swaps, location_hash = switch_positions_in_place_tracked(new_location, switches, location_hash, conflicts, excluded)
+
+    return new_location, swaps, location_hash
+
+
+def switch_positions_in_place_tracked(location, switches, location_hash=0, conflicts=None, excluded=None):
+    if isinstance(location, numpy.ndarray):
+        # a board row is swapped as a list, numpy scalar reads cost more than the copy, and only the swapped columns go back
+        working = location.tolist()
+        swaps, location_hash = switch_positions_in_place_tracked(working, switches, location_hash, conflicts, excluded)
+        for first_swap, last_swap in swaps:
+            location[first_swap] = working[first_swap]
+            location[last_swap] = working[last_swap]
+        return swaps, location_hash
+
+    swaps = []
+    for x in range(0, switches):
+        first_swap, last_swap = select_swap_positions(len(location), conflicts)
+        retries = 0
+        while excluded and (first_swap, last_swap) in excluded and retries < len(location):
+            first_swap, last_swap = select_swap_positions(len(location), conflicts)
+            retries += 1
+        location_hash = swap_hash(location_hash, location, first_swap, last_swap)
+        swap_positions_in_place(location, first_swap, last_swap)
+        swaps.append((first_swap, last_swap))
+
+    return swaps, location_hash
+
+
+def is_outside_half(location):
+    return 2 * int(location[0]) > len(location) - 1
+
+
+def reflect_location(location):
+    last = len(location) - 1
+    return [last - value for value in location]
+
+
+def create_mutants(location, count, switches, generator=None):
+    if generator is None:
+        generator = random_stream('mutants')
+
+    dimensions = len(location)
+    mutants = numpy.tile(numpy.asarray(location, dtype=numpy.int64), (count, 1))
+    rows = numpy.arange(count)
+    for x in range(0, switches):
+        first_swap = generator.integers(0, dimensions, count)
+        last_swap = (first_swap + generator.integers(1, dimensions, count)) % dimensions
+        first_val = mutants[rows, first_swap]
+        mutants[rows, first_swap] = mutants[rows, last_swap]
+        mutants[rows, last_swap] = first_val
+
+    return mutants
+
+
+def zobrist_table(dimensions):
+    if dimensions not in zobrist_tables:
+        generator = random.Random(dimensions)
+        zobrist_tables[dimensions] = [[generator.getrandbits(64) for row in range(0, dimensions)]
+                                      for column in range(0, dimensions)]
+
+    return zobrist_tables[dimensions]
+
+
+def hash_location(location):
+    table = zobrist_table(len(location))
+    location_hash = 0
+    for column in range(0, len(location)):
+        location_hash ^= table[column][location[column]]
+
+    return location_hash
+
+
+def move_hash(location_hash, dimensions, column, old_row, new_row):
+    table = zobrist_table(dimensions)
+    return location_hash ^ table[column][old_row] ^ table[column][new_row]
+
+
+def swap_hash(location_hash, location, first_swap, last_swap):
+    table = zobrist_table(len(location))
+    first_column = table[first_swap]
+    last_column = table[last_swap]
+    first_val = location[first_swap]
+    last_val = location[last_swap]
+
+    return location_hash ^ first_column[first_val] ^ last_column[last_val] ^ first_column[last_val] ^ last_column[first_val]
+
+def seed_random_streams(seed):
+    global random_seed
+    random_seed = seed
+    random_streams.clear()
+
+
+def random_stream(name):
+    if name not in random_streams:
+        sequence = numpy.random.SeedSequence(random_seed, spawn_key=(zlib.crc32(name.encode()),))
+        random_streams[name] = numpy.random.default_rng(sequence)
+
+    return random_streams[name]
+
+
+def create_random_location(dimensions, generator=None):
+    generator = generator if generator is not None else random_stream('locations')
+    return generator.permutation(dimensions).tolist()
+
+
+def create_random_locations(dimensions, count, generator=None):
+    generator = generator if generator is not None else random_stream('locations')
+    return generator.permuted(numpy.tile(numpy.arange(dimensions), (count, 1)), axis=1)
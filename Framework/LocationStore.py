@@ -11,8 +11,9 @@ class LocationStore:
         self.locations = []
         
     def insert(self, location, value):
-        if location not in self.location_store:
-            self.location_store[location] = value
+        location_hash = GeneticFunctions.hash_location(location)
+        if location_hash not in self.location_store:
+            self.location_store[location_hash] = value
             self.locations.append(location)
 
     def select_at_random(self):
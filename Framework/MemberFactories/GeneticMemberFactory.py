@@ -7,5 +7,5 @@ class GeneticMemberFactory(MemberFactory):
     def __init__(self, parameters):
         self.parameters = parameters
 
-    def build(self, demeLocation, location_store):
-        return GeneticMember(self.parameters, demeLocation, 1)
\ No newline at end of file
+    def build(self, demeLocation, location_store, recycled=None):
+        return self.create(GeneticMember, recycled, self.parameters, demeLocation, 1)
\ No newline at end of file
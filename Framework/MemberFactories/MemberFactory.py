@@ -1,4 +1,21 @@
+from Framework.DemeControllers.DemeSlot import DemeSlot
+
+
 class MemberFactory:
 
     def build(self):
-        pass
\ No newline at end of file
+        pass
+
+    @staticmethod
+    def create(member_type, recycled, *arguments):
+        if recycled is None:
+            return member_type(*arguments)
+
+        if isinstance(recycled, DemeSlot):
+            # a new member is bound to its deme slot before it initialises so it writes straight into the deme arrays
+            target = recycled
+            recycled = member_type.__new__(member_type)
+            target.population.bind(target.slot, recycled)
+
+        recycled.__init__(*arguments)
+        return recycled
@@ -1,37 +1,137 @@
 import random
 
+from Framework.DemeControllers.DetachedRows import DetachedRows
 from Framework.Genetics import GeneticFunctions
 
 
 class GeneticMember:
 
+    __slots__ = ('parameters', 'mutationCount', 'population', 'slot', 'currentHash',
+                 'boardState', 'pendingSwaps', 'dirty', 'memberFactory')
+
     def __init__(self, parameters, demeLocation, mutationCount):
         self.parameters = parameters
-        self.bestPerformance = 9999999999
         self.mutationCount = mutationCount
-        self.initialLocation = self.selectLocation(demeLocation)
-        self.currentLocation = self.initialLocation
-        self.bestLocation = self.currentLocation
-        self.age = 0
+        initialLocation = self.selectLocation(demeLocation)
+        if parameters.restrict_symmetry and GeneticFunctions.is_outside_half(initialLocation):
+            initialLocation = GeneticFunctions.reflect_location(initialLocation)
+        # a recycled member is already bound to its deme slot, a new one keeps its rows detached until a deme inserts it
+        population = getattr(self, 'population', None)
+        if population is None:
+            population = self.population = DetachedRows(len(initialLocation))
+            self.slot = 0
+        else:
+            population.reset(self.slot)
+        boards = population.boards
+        boards[self.slot] = initialLocation
+        population.best_boards[self.slot] = boards[self.slot]
+        self.currentHash = GeneticFunctions.hash_location(initialLocation)
+        self.boardState = None
+        self.pendingSwaps = []
+        self.dirty = True
+        self.memberFactory = None
+
+    # both locations are views of the member's rows, callers copy them when they need them to stay put
+    @property
+    def currentLocation(self):
+        return self.population.boards[self.slot]
+
+    @currentLocation.setter
+    def currentLocation(self, location):
+        self.population.boards[self.slot] = location
+
+    @property
+    def bestLocation(self):
+        return self.population.best_boards[self.slot]
+
+    @bestLocation.setter
+    def bestLocation(self, location):
+        self.population.best_boards[self.slot] = location
+
+    @property
+    def bestPerformance(self):
+        return self.population.best_fitness[self.slot]
+
+    @bestPerformance.setter
+    def bestPerformance(self, performance):
+        self.population.best_fitness[self.slot] = performance
+
+    @property
+    def age(self):
+        return self.population.ages[self.slot]
+
+    @age.setter
+    def age(self, age):
+        self.population.ages[self.slot] = age
 
     def get_BestFitness(self):
         return self.bestPerformance
 
     def update(self):
-        self.currentLocation = self.selectLocation(self.currentLocation)
-        self.age += 1
+        if type(self).selectLocation is GeneticMember.selectLocation:
+            swaps, self.currentHash = self.mutateLocation(self.currentLocation, self.currentHash)
+            if self.boardState is not None:
+                self.pendingSwaps.extend(swaps)
+        else:
+            # an overridden selectLocation picks the next location itself, so there are no swaps to replay
+            location = self.selectLocation(self.currentLocation)
+            self.currentLocation = location
+            self.currentHash = GeneticFunctions.hash_location(location)
+            self.boardState = None
+            self.pendingSwaps = []
+        if self.parameters.restrict_symmetry and GeneticFunctions.is_outside_half(self.currentLocation):
+            self.reflectLocation()
+        self.dirty = True
+        self.population.ages[self.slot] += 1
 
-    def evaluate(self, evaluator):
-        result = evaluator.evaluate(self.currentLocation)
+    def assignLocation(self, location):
+        # the location is taken as it is, without the mutation a newly built member applies to its deme location
+        self.population.reset(self.slot)
+        self.currentLocation = location
+        self.bestLocation = self.currentLocation
+        self.currentHash = GeneticFunctions.hash_location(self.currentLocation.tolist())
+        self.boardState = None
+        self.pendingSwaps = []
+        self.dirty = True
 
-        if result < self.bestPerformance:
-            self.bestPerformance = result
-            self.bestLocation = self.currentLocation
+    def evaluate(self, evaluator):
+        return self.applyResult(self.evaluateLocation(evaluator))
 
+    def applyResult(self, result):
+        self.dirty = False
+        population = self.population
+        slot = self.slot
+        population.fitness[slot] = result
+        if result < population.best_fitness[slot]:
+            population.best_fitness[slot] = result
+            population.best_boards[slot] = population.boards[slot]
+    
         return result
 
+    def evaluateLocation(self, evaluator):
+        if not getattr(evaluator, 'incremental', False):
+            return evaluator.evaluate(self.currentLocation.tolist(), self.currentHash)
+
+        if self.boardState is None:
+            self.boardState = evaluator.create_board_state(self.currentLocation.tolist())
+            self.pendingSwaps = []
+
+        swaps = self.pendingSwaps
+        self.pendingSwaps = []
+        return evaluator.evaluate_swaps(self.boardState, swaps)
+
+    def reflectLocation(self):
+        location = GeneticFunctions.reflect_location(self.currentLocation.tolist())
+        self.currentLocation = location
+        self.currentHash = GeneticFunctions.hash_location(location)
+        self.boardState = None
+        self.pendingSwaps = []
+
+    def mutateLocation(self, location, location_hash):
+        return GeneticFunctions.switch_positions_in_place_tracked(location, self.mutationCount, location_hash)
+
     def selectLocation(self, demeLocation):
         currentLocation = demeLocation
         currentLocation = GeneticFunctions.switch_positions(currentLocation, self.mutationCount)
 
-        return currentLocation
\ No newline at end of file
+        return currentLocation
@@ -1,10 +1,18 @@
 
 
+import random
+
+from Framework.Genetics import GeneticFunctions
+
+
 class RunController:
 
     def __init__(self, parameters, location_store):
         self.parameters = parameters
         self.location_store = location_store
+        if parameters.seed is not None:
+            random.seed(parameters.seed)
+            GeneticFunctions.seed_random_streams(parameters.seed)
 
     def update(self, problem):
         pass
@@ -0,0 +1,54 @@
+import queue
+import threading
+
+from Framework.SolutionSinks.SolutionSink import SolutionSink
+
+
+class BackgroundSolutionSink(SolutionSink):
+
+    def __init__(self, target, max_queue=10000):
+        self.target = target
+        self.records = queue.Queue(max_queue)
+        self.dropped = 0
+        self.error = None
+        self.writer = threading.Thread(target=self.write_records, daemon=True)
+        self.writer.start()
+
+    def write(self, record):
+        # the search never waits on the writer, a record that finds the queue full is dropped and counted
+        try:
+            self.records.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def write_records(self):
+        while True:
+            record = self.records.get()
+            try:
+                if record is None:
+                    return
+                if self.error is None:
+                    self.target.write(record)
+            except Exception as error:
+                # the first failure is kept for flush and close, later records are drained without being written
+                self.error = error
+            finally:
+                self.records.task_done()
+
+    def raise_error(self):
+        error = self.error
+        if error is not None:
+            self.error = None
+            raise error
+
+    def flush(self):
+        self.records.join()
+        self.raise_error()
+        self.target.flush()
+
+    def close(self):
+        if self.writer.is_alive():
+            self.records.put(None)
+            self.writer.join()
+        self.target.close()
+        self.raise_error()
@@ -0,0 +1,24 @@
+from Framework.SolutionSinks.SolutionSink import SolutionSink
+
+
+class BufferedFileSolutionSink(SolutionSink):
+
+    def __init__(self, filename, buffer_size=1000):
+        self.file = open(filename, "w")
+        self.buffer_size = buffer_size
+        self.buffer = []
+
+    def write(self, record):
+        self.buffer.append(record.format_line() + " ----------> " + str(record.timestamp) + "\n")
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if len(self.buffer) > 0:
+            self.file.write("".join(self.buffer))
+            self.buffer = []
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
@@ -0,0 +1,7 @@
+from Framework.SolutionSinks.SolutionSink import SolutionSink
+
+
+class NullSolutionSink(SolutionSink):
+
+    def write(self, record):
+        pass
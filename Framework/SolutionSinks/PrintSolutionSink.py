@@ -0,0 +1,7 @@
+from Framework.SolutionSinks.SolutionSink import SolutionSink
+
+
+class PrintSolutionSink(SolutionSink):
+
+    def write(self, record):
+        print(record.format_line())
@@ -0,0 +1,13 @@
+import time
+
+
+class SolutionRecord:
+
+    def __init__(self, board, evaluations, solution_count):
+        self.board = board
+        self.evaluations = evaluations
+        self.solution_count = solution_count
+        self.timestamp = time.time()
+
+    def format_line(self):
+        return "#".join((str(v) for v in self.board)) + ' ===== ' + str(self.solution_count) + " ----------> " + str(self.evaluations)
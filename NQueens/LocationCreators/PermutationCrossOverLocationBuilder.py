@@ -0,0 +1,24 @@
+import random
+
+from Framework.Genetics import GeneticFunctions
+from NQueens.LocationCreators.CrossOverLocationBuilder import CrossOverLocationBuilder
+
+
+class PermutationCrossOverLocationBuilder(CrossOverLocationBuilder):
+
+    def __init__(self, parameters):
+        super(PermutationCrossOverLocationBuilder, self).__init__(parameters)
+        self.operators = [GeneticFunctions.create_pmx_crossover,
+                          GeneticFunctions.create_order_crossover,
+                          GeneticFunctions.create_cycle_crossover]
+
+    def build(self, build_params):
+        location_store = build_params.location_store
+        loc_one = location_store.select_at_random()
+        loc_two = location_store.select_at_random()
+
+        if sorted(loc_one) != sorted(loc_two):
+            return list(loc_one)
+
+        operator = self.operators[random.randint(0, len(self.operators) - 1)]
+        return operator(loc_one, loc_two)
@@ -0,0 +1,13 @@
+import random
+from Framework.MemberFactories.GeneticMemberFactory import GeneticMemberFactory
+from NQueens.Members.NQueensAdaptiveMutationMember import NQueensAdaptiveMutationMember
+
+
+class NQueensAdaptiveMutationMemberFactory(GeneticMemberFactory):
+
+    def __init__(self, parameters):
+        super(NQueensAdaptiveMutationMemberFactory, self).__init__(parameters)
+
+    def build(self, deme_location, location_store, recycled=None):
+        mutations = random.randint(1, self.parameters.dimensions - 1)
+        return self.create(NQueensAdaptiveMutationMember, recycled, self.parameters, deme_location, mutations)
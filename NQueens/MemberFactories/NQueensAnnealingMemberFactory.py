@@ -0,0 +1,11 @@
+from Framework.MemberFactories.GeneticMemberFactory import GeneticMemberFactory
+from NQueens.Members.NQueensAnnealingMember import NQueensAnnealingMember
+
+
+class NQueensAnnealingMemberFactory(GeneticMemberFactory):
+
+    def __init__(self, parameters):
+        super(NQueensAnnealingMemberFactory, self).__init__(parameters)
+
+    def build(self, deme_location, location_store, recycled=None):
+        return self.create(NQueensAnnealingMember, recycled, self.parameters, deme_location, 1)
@@ -8,6 +8,6 @@ class NQueensGeneticMemberFactory(GeneticMemberFactory):
     def __init__(self, parameters):
         super(NQueensGeneticMemberFactory, self).__init__(parameters)
 
-    def build(self, deme_location, location_store):
+    def build(self, deme_location, location_store, recycled=None):
         new_location = GeneticFunctions.switch_positions(deme_location, 3)
-        return NQueensGeneticMember(self.parameters, new_location, self.parameters.mutation_count)
+        return self.create(NQueensGeneticMember, recycled, self.parameters, new_location, self.parameters.mutation_count)
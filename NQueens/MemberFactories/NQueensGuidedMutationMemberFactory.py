@@ -0,0 +1,11 @@
+from Framework.MemberFactories.GeneticMemberFactory import GeneticMemberFactory
+from NQueens.Members.NQueensGuidedMutationMember import NQueensGuidedMutationMember
+
+
+class NQueensGuidedMutationMemberFactory(GeneticMemberFactory):
+
+    def __init__(self, parameters):
+        super(NQueensGuidedMutationMemberFactory, self).__init__(parameters)
+
+    def build(self, deme_location, location_store, recycled=None):
+        return self.create(NQueensGuidedMutationMember, recycled, self.parameters, deme_location, self.parameters.mutation_count)
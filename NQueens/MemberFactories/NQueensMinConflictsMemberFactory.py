@@ -0,0 +1,11 @@
+from Framework.MemberFactories.GeneticMemberFactory import GeneticMemberFactory
+from NQueens.Members.NQueensMinConflictsMember import NQueensMinConflictsMember
+
+
+class NQueensMinConflictsMemberFactory(GeneticMemberFactory):
+
+    def __init__(self, parameters):
+        super(NQueensMinConflictsMemberFactory, self).__init__(parameters)
+
+    def build(self, deme_location, location_store, recycled=None):
+        return self.create(NQueensMinConflictsMember, recycled, self.parameters, deme_location, self.parameters.mutation_count)
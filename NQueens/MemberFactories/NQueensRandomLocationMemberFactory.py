@@ -8,6 +8,6 @@ class NQueensRandomLocationMemberFactory(GeneticMemberFactory):
     def __init__(self, parameters):
         super(NQueensRandomLocationMemberFactory, self).__init__(parameters)
 
-    def build(self, deme_location, location_store):
+    def build(self, deme_location, location_store, recycled=None):
         new_location = GeneticFunctions.create_random_location(self.parameters.dimensions)
-        return NQueensGeneticMember(self.parameters, new_location, 1)
+        return self.create(NQueensGeneticMember, recycled, self.parameters, new_location, 1)
@@ -8,6 +8,6 @@ class NQueensRandomMutationMemberFactory(GeneticMemberFactory):
     def __init__(self, parameters):
         super(NQueensRandomMutationMemberFactory, self).__init__(parameters)
 
-    def build(self, deme_location, location_store):
+    def build(self, deme_location, location_store, recycled=None):
         mutations = random.randint(1, self.parameters.dimensions - 1)
-        return NQueensGeneticMember(self.parameters, deme_location, mutations)
+        return self.create(NQueensGeneticMember, recycled, self.parameters, deme_location, mutations)
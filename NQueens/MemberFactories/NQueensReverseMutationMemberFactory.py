@@ -8,6 +8,6 @@ class NQueensReverseMutationMemberFactory(GeneticMemberFactory):
     def __init__(self, parameters):
         super(NQueensReverseMutationMemberFactory, self).__init__(parameters)
 
-    def build(self, deme_location, location_store):
+    def build(self, deme_location, location_store, recycled=None):
         location = deme_location[::-1]
-        return NQueensGeneticMember(self.parameters, location, self.parameters.mutation_count)
+        return self.create(NQueensGeneticMember, recycled, self.parameters, location, self.parameters.mutation_count)
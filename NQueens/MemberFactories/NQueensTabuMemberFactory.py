@@ -0,0 +1,11 @@
+from Framework.MemberFactories.GeneticMemberFactory import GeneticMemberFactory
+from NQueens.Members.NQueensTabuMember import NQueensTabuMember
+
+
+class NQueensTabuMemberFactory(GeneticMemberFactory):
+
+    def __init__(self, parameters):
+        super(NQueensTabuMemberFactory, self).__init__(parameters)
+
+    def build(self, deme_location, location_store, recycled=None):
+        return self.create(NQueensTabuMember, recycled, self.parameters, deme_location, 1)
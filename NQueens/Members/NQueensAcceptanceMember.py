@@ -0,0 +1,64 @@
+from Framework.Genetics import GeneticFunctions
+from NQueens.NQueensGeneticMenber import NQueensGeneticMember
+
+
+class NQueensAcceptanceMember(NQueensGeneticMember):
+
+    __slots__ = ('acceptedHash', 'acceptedPerformance', 'lastSwaps', 'undoable')
+
+    def __init__(self, parameters, demeLocation, mutationCount):
+        super(NQueensAcceptanceMember, self).__init__(parameters, demeLocation, mutationCount)
+        self.acceptedHash = self.currentHash
+        self.acceptedPerformance = None
+        self.lastSwaps = []
+        self.undoable = True
+
+    def mutateLocation(self, location, location_hash):
+        self.lastSwaps, location_hash = GeneticFunctions.switch_positions_in_place_tracked(
+            location, self.mutationCount, location_hash, None, self.excludedSwaps())
+        self.undoable = True
+        return self.lastSwaps, location_hash
+
+    def assignLocation(self, location):
+        super(NQueensAcceptanceMember, self).assignLocation(location)
+        self.acceptedHash = self.currentHash
+        self.acceptedPerformance = None
+        self.lastSwaps = []
+        self.undoable = True
+
+    def applyResult(self, result):
+        result = super(NQueensAcceptanceMember, self).applyResult(result)
+
+        if self.acceptedPerformance is None or self.accept(result):
+            self.acceptedHash = self.currentHash
+            self.acceptedPerformance = result
+        else:
+            self.reject()
+
+        return result
+
+    def reflectLocation(self):
+        super(NQueensAcceptanceMember, self).reflectLocation()
+        self.undoable = False
+
+    def reject(self):
+        # the accepted location is rebuilt in the member's row by undoing the reflection and then the swaps
+        location = self.currentLocation
+        if not self.undoable:
+            self.boardState = None
+            self.currentLocation = GeneticFunctions.reflect_location(location.tolist())
+
+        for first_swap, last_swap in reversed(self.lastSwaps):
+            GeneticFunctions.swap_positions_in_place(location, first_swap, last_swap)
+            if self.boardState is not None:
+                self.boardState.swap(first_swap, last_swap)
+
+        self.lastSwaps = []
+        self.undoable = True
+        self.currentHash = self.acceptedHash
+
+    def accept(self, result):
+        return result <= self.acceptedPerformance
+
+    def excludedSwaps(self):
+        return None
@@ -0,0 +1,42 @@
+from NQueens.NQueensGeneticMenber import NQueensGeneticMember
+
+
+class NQueensAdaptiveMutationMember(NQueensGeneticMember):
+
+    __slots__ = ('mutationStrength', 'adaptation_window', 'previousPerformance', 'trials', 'successes')
+
+    def __init__(self, parameters, demeLocation, mutationCount):
+        super(NQueensAdaptiveMutationMember, self).__init__(parameters, demeLocation, mutationCount)
+        self.mutationStrength = float(mutationCount)
+        self.adaptation_window = parameters.adaptation_window
+        self.previousPerformance = None
+        self.trials = 0
+        self.successes = 0
+
+    def assignLocation(self, location):
+        super(NQueensAdaptiveMutationMember, self).assignLocation(location)
+        self.previousPerformance = None
+
+    def applyResult(self, result):
+        if self.previousPerformance is not None:
+            self.trials += 1
+            if result < self.previousPerformance:
+                self.successes += 1
+            if self.trials >= self.adaptation_window:
+                self.adaptMutationStrength()
+
+        self.previousPerformance = result
+        return super(NQueensAdaptiveMutationMember, self).applyResult(result)
+
+    def adaptMutationStrength(self):
+        # one-fifth success rule: widen the search while it pays, narrow it when it does not
+        success_rate = self.successes / self.trials
+        if success_rate > 0.2:
+            self.mutationStrength *= 1.22
+        elif success_rate < 0.2:
+            self.mutationStrength /= 1.22
+
+        self.mutationStrength = min(max(self.mutationStrength, 1.0), float(len(self.currentLocation) - 1))
+        self.mutationCount = int(round(self.mutationStrength))
+        self.trials = 0
+        self.successes = 0
@@ -0,0 +1,21 @@
+import math
+import random
+
+from NQueens.Members.NQueensAcceptanceMember import NQueensAcceptanceMember
+
+
+class NQueensAnnealingMember(NQueensAcceptanceMember):
+
+    __slots__ = ('temperature', 'cooling_rate')
+
+    def __init__(self, parameters, demeLocation, mutationCount):
+        super(NQueensAnnealingMember, self).__init__(parameters, demeLocation, mutationCount)
+        self.temperature = parameters.initial_temperature
+        self.cooling_rate = parameters.cooling_rate
+
+    def accept(self, result):
+        difference = result - self.acceptedPerformance
+        accepted = difference <= 0 or random.random() < math.exp(-difference / self.temperature)
+        self.temperature = max(self.temperature * self.cooling_rate, 0.000001)
+
+        return accepted
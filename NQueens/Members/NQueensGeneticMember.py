@@ -6,6 +6,8 @@ from Framework.Members.GeneticMember import GeneticMember
 
 class NQueensGeneticMember(GeneticMember):
 
+    __slots__ = ()
+
     def __init__(self, parameters, demeLocation, mutationCount):
         super(NQueensGeneticMember, self).__init__(parameters, demeLocation, mutationCount)
 
@@ -0,0 +1,27 @@
+from Framework.Genetics import GeneticFunctions
+from NQueens.NQueensGeneticMenber import NQueensGeneticMember
+
+
+class NQueensGuidedMutationMember(NQueensGeneticMember):
+
+    __slots__ = ('conflicts',)
+
+    def __init__(self, parameters, demeLocation, mutationCount):
+        super(NQueensGuidedMutationMember, self).__init__(parameters, demeLocation, mutationCount)
+        self.conflicts = None
+
+    def assignLocation(self, location):
+        super(NQueensGuidedMutationMember, self).assignLocation(location)
+        self.conflicts = None
+
+    def evaluateLocation(self, evaluator):
+        if getattr(evaluator, 'incremental', False):
+            result = super(NQueensGuidedMutationMember, self).evaluateLocation(evaluator)
+            self.conflicts = self.boardState.conflicting_columns()
+            return result
+
+        result, self.conflicts = evaluator.evaluate_profile(self.currentLocation.tolist(), self.currentHash)
+        return result
+
+    def mutateLocation(self, location, location_hash):
+        return GeneticFunctions.switch_positions_in_place_tracked(location, self.mutationCount, location_hash, self.conflicts)
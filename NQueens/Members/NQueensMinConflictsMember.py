@@ -0,0 +1,34 @@
+import random
+
+from Framework.Genetics import GeneticFunctions
+from NQueens.NQueensBoardState import NQueensBoardState
+from NQueens.NQueensGeneticMenber import NQueensGeneticMember
+
+
+class NQueensMinConflictsMember(NQueensGeneticMember):
+
+    __slots__ = ()
+
+    def __init__(self, parameters, demeLocation, mutationCount):
+        super(NQueensMinConflictsMember, self).__init__(parameters, demeLocation, mutationCount)
+        self.boardState = NQueensBoardState(self.currentLocation.tolist())
+
+    def assignLocation(self, location):
+        super(NQueensMinConflictsMember, self).assignLocation(location)
+        self.boardState = NQueensBoardState(self.currentLocation.tolist())
+
+    def update(self):
+        conflicts = self.boardState.conflicting_columns()
+        if len(conflicts) > 0:
+            column = random.choice(conflicts)
+            old_row = self.boardState.location[column]
+            new_row = random.choice(self.boardState.least_attacked_rows(column))
+            self.boardState.move(column, new_row)
+            self.currentLocation[column] = new_row
+            self.currentHash = GeneticFunctions.move_hash(self.currentHash, self.boardState.dimensions, column, old_row, new_row)
+
+        self.dirty = True
+        self.age += 1
+
+    def evaluateLocation(self, evaluator):
+        return evaluator.evaluate_state(self.boardState)
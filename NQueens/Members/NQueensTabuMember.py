@@ -0,0 +1,22 @@
+from collections import deque
+
+from NQueens.Members.NQueensAcceptanceMember import NQueensAcceptanceMember
+
+
+class NQueensTabuMember(NQueensAcceptanceMember):
+
+    __slots__ = ('tabu',)
+
+    def __init__(self, parameters, demeLocation, mutationCount):
+        super(NQueensTabuMember, self).__init__(parameters, demeLocation, mutationCount)
+        self.tabu = deque(maxlen=parameters.tabu_size)
+
+    def accept(self, result):
+        accepted = super(NQueensTabuMember, self).accept(result)
+        if accepted:
+            self.tabu.extend(self.lastSwaps)
+
+        return accepted
+
+    def excludedSwaps(self):
+        return set(self.tabu)
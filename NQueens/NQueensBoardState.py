@@ -0,0 +1,106 @@
+class NQueensBoardState:
+
+    def __init__(self, location):
+        self.location = list(location)
+        self.dimensions = len(self.location)
+        rows = [0] * self.dimensions
+        diagonals = [0] * ((2 * self.dimensions) - 1)
+        anti_diagonals = [0] * ((2 * self.dimensions) - 1)
+        attacking_count = 0
+
+        # place() for every column, inlined on locals because every new member builds one of these
+        offset = self.dimensions - 1
+        column = 0
+        for row in self.location:
+            diagonal = column - row + offset
+            anti_diagonal = column + row
+            if rows[row] > 0:
+                attacking_count += 1
+            attacking_count += 2 * (diagonals[diagonal] + anti_diagonals[anti_diagonal])
+            rows[row] += 1
+            diagonals[diagonal] += 1
+            anti_diagonals[anti_diagonal] += 1
+            column += 1
+
+        self.rows = rows
+        self.diagonals = diagonals
+        self.anti_diagonals = anti_diagonals
+        self.attacking_count = attacking_count
+
+    def get_location(self):
+        return list(self.location)
+
+    def conflicting_columns(self):
+        conflicts = []
+        for column in range(0, self.dimensions):
+            row = self.location[column]
+            if self.rows[row] > 1 \
+                    or self.diagonals[column - row + self.dimensions - 1] > 1 \
+                    or self.anti_diagonals[column + row] > 1:
+                conflicts.append(column)
+
+        return conflicts
+
+    def least_attacked_rows(self, column):
+        current_row = self.location[column]
+        best_rows = []
+        best_cost = None
+        for row in range(0, self.dimensions):
+            own = 1 if row == current_row else 0
+            diagonal = self.diagonals[column - row + self.dimensions - 1] - own
+            anti_diagonal = self.anti_diagonals[column + row] - own
+            cost = (1 if self.rows[row] - own > 0 else 0) + 2 * (diagonal + anti_diagonal)
+
+            if best_cost is None or cost < best_cost:
+                best_cost = cost
+                best_rows = [row]
+            elif cost == best_cost:
+                best_rows.append(row)
+
+        return best_rows
+
+    def move(self, column, row):
+        self.remove(column, self.location[column])
+        self.place(column, row)
+        self.location[column] = row
+
+        return self.attacking_count
+
+    def swap(self, first, last):
+        first_row = self.location[first]
+        last_row = self.location[last]
+
+        self.remove(first, first_row)
+        self.remove(last, last_row)
+        self.place(first, last_row)
+        self.place(last, first_row)
+
+        self.location[first] = last_row
+        self.location[last] = first_row
+
+        return self.attacking_count
+
+    def place(self, column, row):
+        diagonal = column - row + self.dimensions - 1
+        anti_diagonal = column + row
+
+        if self.rows[row] > 0:
+            self.attacking_count += 1
+        # every queen already on a diagonal attacks the new one and is attacked by it
+        self.attacking_count += 2 * (self.diagonals[diagonal] + self.anti_diagonals[anti_diagonal])
+
+        self.rows[row] += 1
+        self.diagonals[diagonal] += 1
+        self.anti_diagonals[anti_diagonal] += 1
+
+    def remove(self, column, row):
+        diagonal = column - row + self.dimensions - 1
+        anti_diagonal = column + row
+
+        self.rows[row] -= 1
+        self.diagonals[diagonal] -= 1
+        self.anti_diagonals[anti_diagonal] -= 1
+
+        if self.rows[row] > 0:
+            self.attacking_count -= 1
+        self.attacking_count -= 2 * (self.diagonals[diagonal] + self.anti_diagonals[anti_diagonal])
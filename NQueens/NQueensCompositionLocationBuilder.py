@@ -0,0 +1,63 @@
+import random
+
+from Framework.Genetics.LocationBuilder import LocationBuilder
+from NQueens.NQueensBoardState import NQueensBoardState
+from NQueens.NQueensHistoricalLocationBuilder import NQueensHistoricalLocationBuilder
+
+
+class NQueensCompositionLocationBuilder(LocationBuilder):
+
+    def __init__(self, parameters, outer_solutions, inner_solutions):
+        super(NQueensCompositionLocationBuilder, self).__init__(parameters)
+        self.outer_solutions = outer_solutions
+        self.inner_solutions = inner_solutions
+        self.toroidal_solutions = [s for s in inner_solutions if self.is_toroidal(s)]
+        self.repairs = 0
+
+    @staticmethod
+    def import_solutions(outer_dimensions, inner_dimensions):
+        return NQueensHistoricalLocationBuilder.import_file(outer_dimensions), \
+            NQueensHistoricalLocationBuilder.import_file(inner_dimensions)
+
+    def build(self, build_params):
+        outer = self.outer_solutions[random.randint(0, len(self.outer_solutions) - 1)]
+        if len(self.toroidal_solutions) > 0:
+            inner = self.toroidal_solutions[random.randint(0, len(self.toroidal_solutions) - 1)]
+            return self.compose(outer, inner)
+
+        inner = self.inner_solutions[random.randint(0, len(self.inner_solutions) - 1)]
+        return self.repair(self.compose(outer, inner))
+
+    def create_compositions(self):
+        for outer in self.outer_solutions:
+            for inner in self.toroidal_solutions:
+                yield self.compose(outer, inner)
+
+    @staticmethod
+    def compose(outer, inner):
+        inner_length = len(inner)
+        return [(outer_row * inner_length) + inner_row for outer_row in outer for inner_row in inner]
+
+    @staticmethod
+    def is_toroidal(location):
+        length = len(location)
+        diagonals = set((column - location[column]) % length for column in range(0, length))
+        anti_diagonals = set((column + location[column]) % length for column in range(0, length))
+
+        return len(diagonals) == length and len(anti_diagonals) == length
+
+    def repair(self, location):
+        state = NQueensBoardState(location)
+        if state.attacking_count == 0:
+            return location
+
+        self.repairs += 1
+        for step in range(0, 50 * len(location)):
+            conflicts = state.conflicting_columns()
+            if len(conflicts) == 0:
+                break
+
+            column = random.choice(conflicts)
+            state.move(column, random.choice(state.least_attacked_rows(column)))
+
+        return state.get_location()
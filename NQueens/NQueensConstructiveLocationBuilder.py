@@ -0,0 +1,143 @@
+import math
+import random
+
+from Framework.Genetics.LocationBuilder import LocationBuilder
+from NQueens.NQueensEvaluation import NQueensEvaluation
+
+
+class NQueensConstructiveLocationBuilder(LocationBuilder):
+
+    def __init__(self, parameters):
+        super(NQueensConstructiveLocationBuilder, self).__init__(parameters)
+        self.dimensions = parameters.dimensions
+        self.multipliers = self.find_multipliers(self.dimensions)
+        self.corner_multipliers = self.find_multipliers(self.dimensions + 1)
+        self.base_dimensions = next((size for size in (self.dimensions - 1, self.dimensions - 2)
+                                     if len(self.find_multipliers(size)) > 0), 0)
+        self.extension_attempts = 4
+
+    @staticmethod
+    def find_multipliers(dimensions):
+        return [k for k in range(2, dimensions - 1)
+                if all(math.gcd(k + d, dimensions) == 1 for d in (-1, 0, 1))]
+
+    def build(self, build_params):
+        if len(self.multipliers) > 0:
+            return self.create_symmetric_location(self.create_modular_location())
+
+        if len(self.corner_multipliers) > 0:
+            return self.create_symmetric_location(self.create_corner_location())
+
+        for attempt in range(0, self.extension_attempts):
+            location = self.create_extended_location()
+            if location is not None:
+                return self.create_symmetric_location(location)
+
+        return self.create_symmetric_location(self.create_explicit_location(self.dimensions))
+
+    @staticmethod
+    def create_symmetric_location(location):
+        symmetries = NQueensEvaluation.create_symmetries(location)
+        return list(symmetries[random.randint(0, len(symmetries) - 1)])
+
+    def create_corner_location(self):
+        # the modular board one size up has its queen at (0, 0) when unshifted, dropping that corner leaves n queens apart
+        multiplier = self.corner_multipliers[random.randint(0, len(self.corner_multipliers) - 1)]
+        return [(multiplier * column) % (self.dimensions + 1) - 1 for column in range(1, self.dimensions + 1)]
+
+    def create_extended_location(self):
+        # n = 2 or 3 mod 6 grows a shifted modular board for n - 1 or n - 2 by one corner queen at a time
+        if self.base_dimensions == 0:
+            return None
+
+        multipliers = self.find_multipliers(self.base_dimensions)
+        location = self.create_symmetric_location(self.create_shifted_location(self.base_dimensions, multipliers))
+        while location is not None and len(location) < self.dimensions:
+            location = self.add_corner_queen(location)
+
+        return location
+
+    @staticmethod
+    def add_corner_queen(location):
+        # the new queen only attacks the queens on the main diagonal, they walk away through swaps that never add a
+        # collision, within a budget that keeps the builder linear in n
+        dimensions = len(location) + 1
+        extended = [0] + [row + 1 for row in location]
+        diagonals = [0] * (2 * dimensions - 1)
+        anti_diagonals = [0] * (2 * dimensions - 1)
+        for column in range(0, dimensions):
+            diagonals[extended[column] - column + dimensions - 1] += 1
+            anti_diagonals[extended[column] + column] += 1
+
+        conflicted = [column for column in range(1, dimensions) if extended[column] == column]
+        collisions = sum(count * (count - 1) // 2 for count in diagonals + anti_diagonals)
+        for step in range(0, 20 * dimensions):
+            while len(conflicted) > 0 and not NQueensConstructiveLocationBuilder.is_attacked(
+                    extended, diagonals, anti_diagonals, conflicted[-1]):
+                conflicted.pop()
+            if collisions == 0 or len(conflicted) == 0:
+                break
+
+            column = conflicted[-1]
+            partner = random.randint(1, dimensions - 2)
+            partner += partner >= column
+            change = NQueensConstructiveLocationBuilder.swap_rows(extended, diagonals, anti_diagonals, column, partner)
+            if change > 0:
+                NQueensConstructiveLocationBuilder.swap_rows(extended, diagonals, anti_diagonals, column, partner)
+                continue
+
+            collisions += change
+            conflicted.append(partner)
+
+        return extended if collisions == 0 else None
+
+    @staticmethod
+    def is_attacked(location, diagonals, anti_diagonals, column):
+        row = location[column]
+        return diagonals[row - column + len(location) - 1] > 1 or anti_diagonals[row + column] > 1
+
+    @staticmethod
+    def swap_rows(location, diagonals, anti_diagonals, first, second):
+        # returns the change in the number of collisions, a queen sharing a diagonal with k others adds k
+        offset = len(location) - 1
+        change = 0
+        for column in (first, second):
+            diagonals[location[column] - column + offset] -= 1
+            anti_diagonals[location[column] + column] -= 1
+            change -= diagonals[location[column] - column + offset] + anti_diagonals[location[column] + column]
+        location[first], location[second] = location[second], location[first]
+        for column in (first, second):
+            change += diagonals[location[column] - column + offset] + anti_diagonals[location[column] + column]
+            diagonals[location[column] - column + offset] += 1
+            anti_diagonals[location[column] + column] += 1
+
+        return change
+
+    def create_modular_location(self):
+        return self.create_shifted_location(self.dimensions, self.multipliers)
+
+    @staticmethod
+    def create_shifted_location(dimensions, multipliers):
+        multiplier = multipliers[random.randint(0, len(multipliers) - 1)]
+        row_shift = random.randint(0, dimensions - 1)
+        column_shift = random.randint(0, dimensions - 1)
+
+        return [((multiplier * (column + column_shift)) + row_shift) % dimensions
+                for column in range(0, dimensions)]
+
+    @staticmethod
+    def create_explicit_location(dimensions):
+        if dimensions == 1:
+            return [0]
+
+        evens = [row for row in range(2, dimensions + 1, 2)]
+        odds = [row for row in range(1, dimensions + 1, 2)]
+        remainder = dimensions % 6
+
+        if remainder == 2:
+            odds = [3, 1] + [row for row in odds if row > 5] + [5]
+        elif remainder == 3:
+            evens = evens[1:] + [2]
+            odds = odds[2:] + [1, 3]
+
+        return [row - 1 for row in evens + odds]
@@ -1,10 +1,16 @@
 from Framework.MemberFactories.GeneticMemberFactory import GeneticMemberFactory
 from NQueens.LocationCreators.NQueensLocationBuilderParameters import NQueensLocationBuilderParameters
+from NQueens.MemberFactories.NQueensAdaptiveMutationMemberFactory import NQueensAdaptiveMutationMemberFactory
+from NQueens.MemberFactories.NQueensAnnealingMemberFactory import NQueensAnnealingMemberFactory
 from NQueens.MemberFactories.NQueensGeneticMemberFactory import NQueensGeneticMemberFactory
+from NQueens.MemberFactories.NQueensGuidedMutationMemberFactory import NQueensGuidedMutationMemberFactory
+from NQueens.MemberFactories.NQueensMinConflictsMemberFactory import NQueensMinConflictsMemberFactory
 from NQueens.MemberFactories.NQueensRandomLocationMemberFactory import NQueensRandomLocationMemberFactory
 from NQueens.MemberFactories.NQueensRandomMutationMemberFactory import NQueensRandomMutationMemberFactory
 from NQueens.MemberFactories.NQueensReverseMutationMemberFactory import NQueensReverseMutationMemberFactory
+from NQueens.MemberFactories.NQueensTabuMemberFactory import NQueensTabuMemberFactory
 from NQueens.NQueensDemeController import NQueensDemeController
+from NQueens.NQueensOperatorSelector import NQueensOperatorSelector
 
 
 class NQueensDemeBuilder:
@@ -14,19 +20,26 @@ class NQueensDemeBuilder:
         self.demes = []
         self.run_controller = run_controller
         self.locationBuildController = locationBuildController
-        self.success_monitor = {}
+        self.success_monitor = NQueensOperatorSelector([type(factory).__name__ for factory in self.get_memberFactories()]) \
+            if parameters.adaptive_operators \
+            else None
 
     def build(self):
         build_param = NQueensLocationBuilderParameters(self.run_controller.location_store)
-        return NQueensDemeController(self.parameters, self.get_memberFactories(), self.locationBuildController, self.run_controller.location_store, build_param)
+        return NQueensDemeController(self.parameters, self.get_memberFactories(), self.locationBuildController, self.run_controller.location_store, build_param, self.success_monitor)
 
     def build_with_location(self, build_param):
-        return NQueensDemeController(self.parameters, self.get_memberFactories(), self.locationBuildController, self.run_controller.location_store, build_param)
+        return NQueensDemeController(self.parameters, self.get_memberFactories(), self.locationBuildController, self.run_controller.location_store, build_param, self.success_monitor)
 
     def get_memberFactories(self):
         return [GeneticMemberFactory(self.parameters),
                 NQueensRandomMutationMemberFactory(self.parameters),
-                NQueensGeneticMemberFactory(self.parameters)]
+                NQueensGeneticMemberFactory(self.parameters),
+                NQueensGuidedMutationMemberFactory(self.parameters),
+                NQueensMinConflictsMemberFactory(self.parameters),
+                NQueensAnnealingMemberFactory(self.parameters),
+                NQueensTabuMemberFactory(self.parameters),
+                NQueensAdaptiveMutationMemberFactory(self.parameters)]
                # NQueensRandomLocationMemberFactory(self.parameters),
             #    NQueensRandomMutationMemberFactory(self.parameters)]
         #return [#NQueensRandomMutationMemberFactory(self.parameters),
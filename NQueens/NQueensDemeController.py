@@ -1,50 +1,95 @@
 import math
 import random
+
 from Framework.DemeControllers.DemeController import DemeController
+from NQueens.Members.NQueensGuidedMutationMember import NQueensGuidedMutationMember
 
 
 class NQueensDemeController(DemeController):
 
-    def __init__(self, parameters, memberFactories, locationBuildController, location_store, build_params):
+    def __init__(self, parameters, memberFactories, locationBuildController, location_store, build_params, operator_selector=None):
         super(NQueensDemeController, self).__init__(parameters, locationBuildController, location_store, build_params)
         self.member_factories = memberFactories
+        self.factory_names = {type(factory).__name__: factory for factory in memberFactories}
+        self.operator_selector = operator_selector
         self.prune_age = parameters.prune_age
         self.successCount = 0
         self.initialise()
 
     def execute_evaluations(self, items, evaluator):
-        for member in items:
-            result = member.evaluate(evaluator)
+        previous = [member.bestPerformance for member in items] if self.operator_selector is not None else None
+        results = self.execute_batch_evaluation(items, evaluator) \
+            if getattr(evaluator, 'batch', False) \
+            else [member.evaluate(evaluator) for member in items]
+
+        for result in results:
             if result == 0:
                 self.successCount += 1
 
+        if self.operator_selector is not None:
+            self.credit_factories(items, previous, results)
+
+    def credit_factories(self, items, previous, results):
+        rewards = {}
+        for index in range(0, len(items)):
+            member = items[index]
+            if member.age == 0 or member.memberFactory is None:
+                continue
+
+            reward = (1 if results[index] < previous[index] else 0) + (1 if results[index] == 0 else 0)
+            rewards.setdefault(type(member.memberFactory).__name__, []).append(reward)
+
+        if len(rewards) > 0:
+            self.operator_selector.credit(rewards)
+
+    def execute_batch_evaluation(self, items, evaluator):
+        if len(items) == 0:
+            return []
+
+        matrix = self.population.boards[[member.slot for member in items]]
+        results = evaluator.evaluate_batch(matrix)
+
+        # guided members mutate from their attacked columns, which the batch scores do not carry
+        guided = [index for index in range(0, len(items)) if isinstance(items[index], NQueensGuidedMutationMember)]
+        if len(guided) > 0:
+            for index, conflicts in zip(guided, evaluator.profile_batch(matrix[guided])):
+                items[index].conflicts = conflicts
+
+        return [member.applyResult(int(result)) for member, result in zip(items, results)]
+
     def update(self):
         super(NQueensDemeController, self).update()
         self.pruneUnsuccessfulMembers()
 
     def pruneUnsuccessfulMembers(self):
-        count = len(self.member_pairs)
-        toPrune = []
-        for index in range(0, count):
-            pair = self.member_pairs[index]
-            if self.is_set_too_old(pair):
-                toPrune.append(index)
-
-        if len(toPrune) > 0:
-            for index in range(len(toPrune)-1, 0, -1):
-                remove_pair = self.member_pairs[toPrune[index]]
-                self.member_pairs.remove(remove_pair)
-                for item in range(0, len(remove_pair)):
-                    self.members.remove(remove_pair[item])
-
-            if len(toPrune) == 1:
-                self.members.clear()
-                self.member_pairs.clear()
+        toPrune = [index for index in range(0, len(self.member_pairs)) if self.is_set_too_old(self.member_pairs[index])]
+
+        if len(toPrune) == 1:
+            self.release_tournaments(self.member_pairs)
+            self.member_pairs = []
+        elif len(toPrune) > 1:
+            # when several tournaments are too old the first of them survives this pass
+            removed = set(toPrune[1:])
+            self.release_tournaments([self.member_pairs[index] for index in removed])
+            self.member_pairs = [self.member_pairs[index] for index in range(0, len(self.member_pairs)) if index not in removed]
+
+    def release_tournaments(self, tournaments):
+        for tournament in tournaments:
+            for slot in tournament:
+                self.release_best(slot)
+                self.recycle_member(self.population.members[slot])
+                self.population.release(slot)
+
+    def get_mutation_strengths(self):
+        return [member.mutationCount for member in self.members]
 
     def get_memberBuilder(self):
+        if self.operator_selector is not None:
+            return self.factory_names[self.operator_selector.select()]
+
         index = random.randint(0, len(self.member_factories) - 1)
         return self.member_factories[index]
 
-    def is_set_too_old(self, pair):
-        eldest = max(pair, key=lambda x: x.age)
-        return eldest.age > self.parameters.prune_age
\ No newline at end of file
+    def is_set_too_old(self, tournament):
+        ages = self.population.ages
+        return max(ages[slot] for slot in tournament) > self.parameters.prune_age
\ No newline at end of file
@@ -1,31 +1,116 @@
 import math
+import operator
+from collections import Counter
 #from elasticsearch import Elasticsearch
 
+import numpy
+
+from Framework.SolutionSinks.PrintSolutionSink import PrintSolutionSink
+from Framework.SolutionSinks.SolutionRecord import SolutionRecord
+from NQueens.NQueensBoardState import NQueensBoardState
+from NQueens.NQueensFitnessCache import NQueensFitnessCache
+from NQueens.NQueensResultStore import NQueensResultStore, pack_board
+
 
 class NQueensEvaluation:
 
-    def __init__(self):
+    def __init__(self, incremental=False, batch=False, cache_size=0, solution_sink=None):
       #  self.es = Elasticsearch()
-        self.resultStore = {}
+        self.incremental = incremental
+        self.batch = batch
+        self.solution_sink = solution_sink if solution_sink is not None else PrintSolutionSink()
+        self.resultStore = NQueensResultStore()
+        self.fundamental_solutions = 0
+        self.total_solutions = 0
         self.evaluations = 0
         self.duplicates = 0
-        self.fails = {}
+        self.fails = NQueensFitnessCache(cache_size) if cache_size > 0 else None
+
+    def evaluate(self, values, location_hash=None):
+        return self.countNumberOfAttackingQueens(values, location_hash)
+
+    def evaluate_profile(self, values, location_hash=None):
+        # the cache only keeps fitness, a cached location comes back without a profile and is mutated at random
+        resultKey = None
+        if self.fails is not None:
+            resultKey = pack_board(values) if location_hash is None else location_hash
+            cached = self.fails.get(resultKey)
+            if cached is not None:
+                self.duplicates += 1
+                return cached, None
+
+        self.evaluations += 1
+        result, conflicts = self.countConflictProfile(values)
+
+        if resultKey is not None:
+            self.fails.put(resultKey, result)
+
+        if result == 0:
+            self.insertResult(values)
+
+        return result, conflicts
+
+    def create_board_state(self, values):
+        return NQueensBoardState(values)
 
-    def evaluate(self, values):
-        result = self.countNumberOfAttackingQueens(values)
+    def evaluate_swaps(self, board_state, swaps):
+        for first_swap, last_swap in swaps:
+            board_state.swap(first_swap, last_swap)
 
-        if result < 0.1:
-            self.attemptRotations(values)
-            self.attemptReflections(values)
+        return self.evaluate_state(board_state)
+
+    def evaluate_state(self, board_state):
+        self.evaluations += 1
+        result = board_state.attacking_count
+
+        if result == 0:
+            self.insertResult(board_state.get_location())
 
         return result
 
-    def attemptReflections(self, board):
-        newBoard = self.reflectBoardX(board)
-        self.countNumberOfAttackingQueens(newBoard)
+    def evaluate_batch(self, matrix):
+        boards = numpy.asarray(matrix, dtype=numpy.int64)
+        members, dimensions = boards.shape
+        if members == 0:
+            return numpy.zeros(0, dtype=numpy.int64)
+
+        self.evaluations += members
+        columns = numpy.arange(dimensions)
+        member_offsets = numpy.arange(members)[:, None]
+
+        rows = self.count_histogram(boards + member_offsets * dimensions, members, dimensions)
+        results = numpy.maximum(rows - 1, 0).sum(axis=1)
+
+        diagonal_size = (2 * dimensions) - 1
+        for diagonal in (columns - boards + dimensions - 1, columns + boards):
+            counts = self.count_histogram(diagonal + member_offsets * diagonal_size, members, diagonal_size)
+            results += (counts * (counts - 1)).sum(axis=1)
+
+        for index in numpy.flatnonzero(results == 0):
+            self.insertResult(boards[index].tolist())
+
+        return results
+
+    def profile_batch(self, matrix):
+        # the attacked columns of every row, as countConflictProfile lists them
+        boards = numpy.asarray(matrix, dtype=numpy.int64)
+        members, dimensions = boards.shape
+        columns = numpy.arange(dimensions)
+        member_offsets = numpy.arange(members)[:, None]
+        diagonal_size = (2 * dimensions) - 1
 
-        newBoard = self.reflectBoardY(board)
-        self.countNumberOfAttackingQueens(newBoard)
+        attacked = numpy.zeros(boards.shape, dtype=bool)
+        for lines, size in ((boards, dimensions),
+                            (columns - boards + dimensions - 1, diagonal_size),
+                            (columns + boards, diagonal_size)):
+            counts = self.count_histogram(lines + member_offsets * size, members, size)
+            attacked |= numpy.take_along_axis(counts, lines, axis=1) > 1
+
+        return [numpy.flatnonzero(row).tolist() for row in attacked]
+
+    @staticmethod
+    def count_histogram(indexes, members, size):
+        return numpy.bincount(indexes.ravel(), minlength=members * size).reshape(members, size)
 
     def reflectBoardX(self, board):
         newBoard = []
@@ -43,16 +128,6 @@ class NQueensEvaluation:
     def reflectBoardY(self, board):
         return [x for x in reversed(board)]
 
-    def attemptRotations(self, board):
-        newBoard = self.rotateBoard(board)
-        self.countNumberOfAttackingQueens(newBoard)
-
-        newBoard = self.rotateBoard(newBoard)
-        self.countNumberOfAttackingQueens(newBoard)
-
-        newBoard = self.rotateBoard(newBoard)
-        self.countNumberOfAttackingQueens(newBoard)
-
     def rotateBoard(self, board):
         board_len = len(board)
         rotated = [0 for b in board]
@@ -61,11 +136,30 @@ class NQueensEvaluation:
 
         return rotated
 
-    def countNumberOfAttackingQueens(self, board):
-        resultHash = self.createResultHash(board)
- #       if resultHash in self.fails:
- #           self.duplicates += 1
- #           return len(board)
+    @staticmethod
+    def create_symmetries(board):
+        board_len = len(board)
+        last = board_len - 1
+        transposed = [0 for b in board]
+        for index in range(0, board_len):
+            transposed[board[index]] = index
+
+        symmetries = []
+        for source in (board, transposed):
+            source = tuple(source)
+            flipped = tuple([last - value for value in source])
+            symmetries.extend([source, source[::-1], flipped, flipped[::-1]])
+
+        return symmetries
+
+    def countNumberOfAttackingQueens(self, board, location_hash=None):
+        resultKey = None
+        if self.fails is not None:
+            resultKey = pack_board(board) if location_hash is None else location_hash
+            cached = self.fails.get(resultKey)
+            if cached is not None:
+                self.duplicates += 1
+                return cached
 
         self.evaluations += 1
 
@@ -77,28 +171,70 @@ class NQueensEvaluation:
 
         attackingCount += dimensions - uniqueValues
 
-        countDiagonals = self.countAttackingDiagonals(board, dimensions)
+        countDiagonals = self.countPermutationDiagonals(board, dimensions) \
+            if uniqueValues == dimensions \
+            else self.countAttackingDiagonals(board, dimensions)
 
         attackingCount += countDiagonals
 
+        if resultKey is not None:
+            self.fails.put(resultKey, attackingCount)
+
         if attackingCount == 0:
-            self.insertResult(board, resultHash)
+            self.insertResult(board)
             return 0
 
-#        self.fails[resultHash] = attackingCount
-
         return attackingCount
 
-    def insertResult(self, board, resultHash):
-        if (resultHash in self.resultStore) is False:
-            self.resultStore[resultHash] = board
-            print(resultHash + ' ===== ' + str(len(self.resultStore)) + " ----------> " + str(self.evaluations))
+    def insertResult(self, board):
+        symmetries = self.create_symmetries(board)
+        canonical = min(symmetries)
+        if self.resultStore.add(canonical):
+            self.fundamental_solutions += 1
+            self.total_solutions += len(set(symmetries))
+            self.solution_sink.write(SolutionRecord(list(canonical), self.evaluations, self.total_solutions))
+
+    def all_solutions(self):
+        for board in self.resultStore:
+            for symmetry in sorted(set(self.create_symmetries(board))):
+                yield list(symmetry)
 
     def createResultHash(self, integerBoard):
         result = "#".join((str(v) for v in integerBoard))
 
         return result
 
+    @staticmethod
+    def countConflictProfile(board):
+        columns = range(0, len(board))
+        rows = Counter(board)
+        diagonals = Counter(map(operator.sub, columns, board))
+        anti_diagonals = Counter(map(operator.add, columns, board))
+
+        attacking = 0
+        for count in rows.values():
+            attacking += count - 1
+        for diagonal in (diagonals, anti_diagonals):
+            for count in diagonal.values():
+                attacking += count * (count - 1)
+
+        conflicts = [column for column in columns
+                     if rows[board[column]] > 1
+                     or diagonals[column - board[column]] > 1
+                     or anti_diagonals[column + board[column]] > 1]
+
+        return attacking, conflicts
+
+    @staticmethod
+    def countPermutationDiagonals(board, boardLength):
+        columns = range(0, boardLength)
+        attacking = 0
+        for diagonal in (Counter(map(operator.sub, columns, board)), Counter(map(operator.add, columns, board))):
+            for count in diagonal.values():
+                attacking += count * (count - 1)
+
+        return attacking
+
     def countAttackingDiagonals(self, board, boardLength):
         attacking = 0
         for index in range(0, boardLength):
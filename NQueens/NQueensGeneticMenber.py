@@ -3,12 +3,16 @@ from Framework.Members.GeneticMember import GeneticMember
 
 class NQueensGeneticMember(GeneticMember):
 
+    __slots__ = ('success_count',)
+
     def __init__(self, parameter, startLocation, mutation_count):
         super(NQueensGeneticMember, self).__init__(parameter, startLocation, mutation_count)
         self.success_count = 0
 
-    def evaluate(self, evaluator):
-        result = super(NQueensGeneticMember, self).evaluate(evaluator)
+    def applyResult(self, result):
+        result = super(NQueensGeneticMember, self).applyResult(result)
 
         if result == 0:
-            self.success_count += 1
\ No newline at end of file
+            self.success_count += 1
+
+        return result
\ No newline at end of file
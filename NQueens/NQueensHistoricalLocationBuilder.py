@@ -24,7 +24,8 @@ class NQueensHistoricalLocationBuilder(LocationBuildController):
 
         return location
 
-    def import_file(self, import_dimensions):
+    @staticmethod
+    def import_file(import_dimensions):
         with open(str(import_dimensions) + "output.txt") as f:
             content = f.readlines()
         cell_values = []
@@ -1,3 +1,4 @@
+from Framework.Genetics import GeneticFunctions
 from Framework.Genetics.LocationBuildController import LocationBuildController
 
 
@@ -14,9 +15,10 @@ class NQueensLocationBuildController(LocationBuildController):
         while not unique_build:
             self.rejected += loop
             location = super(NQueensLocationBuildController, self).build(build_params)
-            unique_build = location not in self.built_locations
+            location_hash = GeneticFunctions.hash_location(location)
+            unique_build = location_hash not in self.built_locations
             loop = 1
 
-        self.built_locations[location] = True
+        self.built_locations[location_hash] = True
 
         return location
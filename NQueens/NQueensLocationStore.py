@@ -1,3 +1,4 @@
+from Framework.Genetics import GeneticFunctions
 from Framework.LocationStore import LocationStore
 
 
@@ -10,8 +11,9 @@ class NQueensLocationStore(LocationStore):
             self.cell_count[x] = [0 for y in range(0, self.parameters.dimensions)]
 
     def insert(self, location, value):
-        if location not in self.location_store:
-            self.location_store[location] = value
+        location_hash = GeneticFunctions.hash_location(location)
+        if location_hash not in self.location_store:
+            self.location_store[location_hash] = value
             self.locations.append(location)
             if value == 0:
                 self.insert_correct_value_to_cells(location)
@@ -0,0 +1,55 @@
+import random
+
+
+class NQueensMigrator:
+
+    def __init__(self, parameters):
+        self.interval = parameters.migration_interval
+        self.rate = parameters.migration_rate
+        self.topology = parameters.migration_topology
+        self.migrations = 0
+
+    def should_migrate(self, iteration):
+        return self.interval > 0 and self.rate > 0 and iteration % self.interval == 0
+
+    def migrate(self, demes):
+        demes = [deme for deme in demes if len(deme.population) > 0]
+        if len(demes) < 2:
+            return
+
+        # every emigrant is collected before any deme is changed so locations move one step per migration
+        routes = self.create_routes(demes)
+        emigrants = [(target, source.get_eliteLocations(self.rate)) for source, target in routes]
+
+        for target, locations in emigrants:
+            target.receive_migrants(locations)
+            self.migrations += len(locations)
+
+    def create_routes(self, demes):
+        if self.topology == 'random':
+            return self.create_random_routes(demes)
+        if self.topology == 'best_to_worst':
+            return self.create_best_to_worst_routes(demes)
+
+        return self.create_ring_routes(demes)
+
+    @staticmethod
+    def create_ring_routes(demes):
+        return [(demes[index], demes[(index + 1) % len(demes)]) for index in range(0, len(demes))]
+
+    @staticmethod
+    def create_random_routes(demes):
+        routes = []
+        for index in range(0, len(demes)):
+            target = random.randint(0, len(demes) - 2)
+            if target >= index:
+                target += 1
+            routes.append((demes[index], demes[target]))
+
+        return routes
+
+    @staticmethod
+    def create_best_to_worst_routes(demes):
+        ordered = sorted(demes, key=lambda deme: deme.bestFitness)
+        half = len(ordered) // 2
+        return [(ordered[index], ordered[len(ordered) - 1 - index]) for index in range(0, half)]
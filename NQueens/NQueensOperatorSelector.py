@@ -0,0 +1,51 @@
+import random
+
+
+class NQueensOperatorSelector:
+
+    def __init__(self, names, adaptation_rate=0.8, learning_rate=0.3, min_probability=None):
+        self.names = names
+        count = len(names)
+        self.min_probability = min_probability if min_probability is not None else 0.2 / count
+        self.max_probability = 1 - ((count - 1) * self.min_probability)
+        self.adaptation_rate = adaptation_rate
+        self.learning_rate = learning_rate
+        self.probabilities = {name: 1.0 / count for name in names}
+        self.qualities = {name: 0.0 for name in names}
+        self.rewards = {name: 0 for name in names}
+        self.selections = {name: 0 for name in names}
+
+    def select(self):
+        choice = random.random()
+        total = 0.0
+        for name in self.names:
+            total += self.probabilities[name]
+            if choice < total:
+                break
+
+        self.selections[name] += 1
+        return name
+
+    def credit(self, rewards):
+        # adaptive pursuit: one step per deme update towards the operator with the best quality estimate, each
+        # credited operator's quality follows its mean reward over the update
+        for name in rewards:
+            self.rewards[name] += sum(rewards[name])
+            reward = sum(rewards[name]) / len(rewards[name])
+            self.qualities[name] += self.adaptation_rate * (reward - self.qualities[name])
+
+        best_quality = max(self.qualities.values())
+        leaders = [name for name in self.names if self.qualities[name] == best_quality]
+        if len(leaders) > 1:
+            # a tie has no operator to pursue, picking the first of them would favour the order of the names
+            return
+
+        for operator in self.names:
+            target = self.max_probability if operator == leaders[0] else self.min_probability
+            self.probabilities[operator] += self.learning_rate * (target - self.probabilities[operator])
+
+    def get_report(self):
+        return {name: {'probability': round(self.probabilities[name], 3),
+                       'quality': round(self.qualities[name], 3),
+                       'rewards': self.rewards[name],
+                       'selections': self.selections[name]} for name in self.names}
@@ -0,0 +1,52 @@
+import sys
+from array import array
+
+
+def pack_board(board):
+    if len(board) <= 256:
+        return bytes(board)
+
+    return array('H', board).tobytes()
+
+
+def unpack_board(packed):
+    if len(packed) <= 256:
+        return list(packed)
+
+    return array('H', packed).tolist()
+
+
+class NQueensResultStore:
+
+    def __init__(self):
+        self.packed = set()
+
+    def __len__(self):
+        return len(self.packed)
+
+    def __contains__(self, board):
+        return pack_board(board) in self.packed
+
+    def __iter__(self):
+        for packed in self.packed:
+            yield unpack_board(packed)
+
+    def add(self, board):
+        packed = pack_board(board)
+        if packed in self.packed:
+            return False
+
+        self.packed.add(packed)
+        return True
+
+    def memory_report(self):
+        packed_bytes = sys.getsizeof(self.packed)
+        string_bytes = sys.getsizeof(dict.fromkeys(range(0, len(self.packed))))
+        for packed in self.packed:
+            board = unpack_board(packed)
+            packed_bytes += sys.getsizeof(packed)
+            string_bytes += sys.getsizeof("#".join((str(v) for v in board))) + sys.getsizeof(board)
+
+        return {'entries': len(self.packed),
+                'packed_bytes': packed_bytes,
+                'string_key_bytes': string_bytes}
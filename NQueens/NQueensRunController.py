@@ -6,6 +6,7 @@ from NQueens.NQueensHistoricalLocationBuilder import NQueensHistoricalLocationBu
 
 from NQueens.NQueensLocationBuildController import NQueensLocationBuildController
 from NQueens.NQueensLocationStore import NQueensLocationStore
+from NQueens.NQueensMigrator import NQueensMigrator
 
 
 class NQueensRunController(RunController):
@@ -19,6 +20,9 @@ class NQueensRunController(RunController):
         self.demeBuilder = NQueensDemeBuilder(parameters, self.locationBuildController, self)
         self.demes = self.initialiseDemes(parameters)
         self.deme_locations = {}
+        self.skipped_evaluations = 0
+        self.migrator = NQueensMigrator(parameters)
+        self.iteration = 0
 
     def update(self, problem):
         super(NQueensRunController, self).update(problem)
@@ -26,9 +30,38 @@ class NQueensRunController(RunController):
             deme.evaluate(problem)
             deme.update()
             if len(deme.members) == 0:
+                self.skipped_evaluations += deme.skipped_evaluations
                 self.demes.remove(deme)
                 self.insertNewDeme()
 
+        self.iteration += 1
+        if self.migrator.should_migrate(self.iteration):
+            self.migrator.migrate(self.demes)
+
+    def get_skipped_evaluations(self):
+        return self.skipped_evaluations + sum(deme.skipped_evaluations for deme in self.demes)
+
+    def get_mutation_strength_statistics(self):
+        strengths = [strength for deme in self.demes for strength in deme.get_mutation_strengths()]
+        if len(strengths) == 0:
+            return {'members': 0}
+
+        return {'members': len(strengths),
+                'min': min(strengths),
+                'mean': sum(strengths) / len(strengths),
+                'max': max(strengths)}
+
+    def get_population_memory(self):
+        reports = [deme.population.memory_report() for deme in self.demes]
+        return {'members': sum(report['members'] for report in reports),
+                'array_bytes': sum(report['array_bytes'] for report in reports)}
+
+    def get_operator_credit(self):
+        if self.demeBuilder.success_monitor is None:
+            return {}
+
+        return self.demeBuilder.success_monitor.get_report()
+
     def insertNewDeme(self):
         build_params = NQueensLocationBuilderParameters(self.location_store)
         newDeme = self.demeBuilder.build_with_location(build_params)
@@ -1,8 +1,10 @@
 import math
+import os
 
 from Framework.Configuration.RunParameters import RunParameters
 from Framework.Genetics.LocationBuilder import LocationBuilder
 from NQueens.LocationCreators.CrossOverLocationBuilder import CrossOverLocationBuilder
+from NQueens.NQueensConstructiveLocationBuilder import NQueensConstructiveLocationBuilder
 from NQueens.NQueensDistributingLocationBuilder import NQueensDistributingLocationBuilder
 from NQueens.NQueensHistoricalLocationBuilder import NQueensHistoricalLocationBuilder
 from NQueens.NQueensHistoryDuplicateLocationBuilder import NQueensHistoricalDuplicateLocationBuilder
@@ -21,7 +23,17 @@ class NQueensRunParameters(RunParameters):
         self.bias = distribution_bias
         self.tournament_size = tournament_size
         self.prune_age = prune_age #math.pow(dimensions, 2)
+        self.initial_temperature = 2.0
+        self.cooling_rate = 0.99
+        self.tabu_size = dimensions
+        self.adaptation_window = 10
+        self.adaptive_operators = True
+        self.migration_interval = 10
+        self.migration_rate = 1
+        self.migration_topology = 'ring'
         #self.location_builders = [CrossOverLocationBuilder(self)] #[NQueensDistributingLocationBuilder(self, [], dimensions - 1)]
         #self.location_builders = [CrossOverLocationBuilder(self)]
-        self.location_builders = [NQueensDistributingLocationBuilder(self, [], import_dimensions)]
+        self.location_builders = [NQueensDistributingLocationBuilder(self, [], import_dimensions)] \
+            if os.path.exists(str(import_dimensions) + "output.txt") \
+            else [NQueensConstructiveLocationBuilder(self)]
     #[CrossOverLocationBuilder(self),
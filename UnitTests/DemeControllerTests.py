@@ -0,0 +1,69 @@
+import random
+import unittest
+
+from Framework.Genetics import GeneticFunctions
+from Framework.SolutionSinks.NullSolutionSink import NullSolutionSink
+from NQueens.NQueensEvaluation import NQueensEvaluation
+from NQueens.NQueensRunController import NQueensRunController
+from NQueens.NQueensRunParameters import NQueensRunParameters
+
+
+class DemeControllerTests(unittest.TestCase):
+
+    def test_tracked_best_matches_a_full_scan_of_the_members(self):
+        random.seed(3)
+        parameters = NQueensRunParameters(8, [8] * 8, 12, 3, [35, 70, 110], 5, 3, 7, False)
+        parameters.total_demes = 4
+        controller = NQueensRunController(parameters)
+        evaluation = NQueensEvaluation()
+
+        for x in range(0, 30):
+            for deme in controller.demes:
+                deme.evaluate(evaluation)
+                members = deme.members
+                if len(members) > 0:
+                    best = min(members, key=lambda member: (member.bestPerformance, member.slot))
+                    self.assertIs(best, deme.get_bestMember())
+                    self.assertEqual(best.bestPerformance, deme.bestFitness)
+                    self.assertEqual(best.bestLocation.tolist(), deme.bestLocation)
+                deme.update()
+            controller.demes = [deme for deme in controller.demes if len(deme.members) > 0]
+
+    def test_rebuilding_the_best_slot_leaves_every_row_to_its_own_member(self):
+        random.seed(3)
+        parameters = NQueensRunParameters(8, [8] * 8, 12, 3, [35, 70, 110], 3, 3, 7, False)
+        parameters.total_demes = 4
+        controller = NQueensRunController(parameters)
+        evaluation = NQueensEvaluation(incremental=True, solution_sink=NullSolutionSink())
+
+        for x in range(0, 30):
+            for deme in controller.demes:
+                deme.evaluate(evaluation)
+                deme.update()
+                for slot in deme.population.occupied_slots():
+                    member = deme.population.members[slot]
+                    self.assertIs(deme.population, member.population)
+                    self.assertEqual(slot, member.slot)
+                    self.assertEqual(GeneticFunctions.hash_location(member.currentLocation.tolist()), member.currentHash)
+            controller.demes = [deme for deme in controller.demes if len(deme.members) > 0]
+
+    def test_member_pooled_by_a_prune_is_reused_by_a_later_rebuild(self):
+        random.seed(3)
+        parameters = NQueensRunParameters(8, [8] * 8, 12, 3, [35, 70, 110], 5, 3, 7, False)
+        parameters.total_demes = 1
+        deme = NQueensRunController(parameters).demes[0]
+        pruned, kept = deme.member_pairs[0], deme.member_pairs[1]
+        initial_type = type(deme.population.members[kept[0]].memberFactory)
+        factory = next(factory for factory in deme.member_factories if type(factory) is not initial_type)
+        for slot in pruned:
+            deme.build_member(factory, deme.bestLocation, slot)
+        pooled = deme.population.members[pruned[-1]]
+
+        deme.release_tournaments([pruned])
+        deme.member_pairs = deme.member_pairs[1:]
+        rebuilt = deme.build_member(factory, deme.bestLocation, kept[0])
+
+        self.assertIs(pooled, rebuilt)
+        self.assertIs(deme.population, rebuilt.population)
+        self.assertEqual(kept[0], rebuilt.slot)
+        self.assertIs(rebuilt, deme.population.members[kept[0]])
@@ -0,0 +1,100 @@
+import unittest
+
+import numpy
+
+from Framework.Configuration.RunParameters import RunParameters
+from Framework.DemeControllers.DemePopulation import DemePopulation
+from Framework.DemeControllers.DetachedRows import DetachedRows
+from Framework.Members.GeneticMember import GeneticMember
+from NQueens.NQueensEvaluation import NQueensEvaluation
+
+
+class DemePopulationTests(unittest.TestCase):
+
+    def test_inserted_member_reads_and_writes_population_rows(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        population = DemePopulation(6, 4)
+        member = GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1)
+        member.evaluate(NQueensEvaluation())
+        location = member.currentLocation.tolist()
+        performance = member.bestPerformance
+
+        slot = population.insert(member)
+        member.age += 1
+
+        self.assertEqual(1, len(population))
+        self.assertEqual(location, population.boards[slot].tolist())
+        self.assertEqual(location, member.bestLocation.tolist())
+        self.assertEqual(performance, population.best_fitness[slot])
+        self.assertEqual(1, population.ages[slot])
+
+    def test_member_locations_are_the_population_rows(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        population = DemePopulation(6, 2)
+        member = GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1)
+        slot = population.insert(member)
+
+        member.update()
+
+        self.assertTrue(numpy.shares_memory(member.currentLocation, population.boards))
+        self.assertTrue(numpy.shares_memory(member.bestLocation, population.best_boards))
+        self.assertEqual(member.currentLocation.tolist(), population.boards[slot].tolist())
+
+    def test_released_slot_is_reused(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        population = DemePopulation(6, 2)
+        first = GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1)
+        second = GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1)
+        slot = population.insert(first)
+        population.insert(second)
+
+        population.release(slot)
+        replacement = GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1)
+
+        self.assertIsNone(first.population)
+        self.assertIsNone(first.slot)
+
+        self.assertEqual(slot, population.insert(replacement))
+        self.assertEqual(9999999999, replacement.bestPerformance)
+        self.assertEqual([slot, second.slot], sorted(population.occupied_slots()))
+
+    def test_population_grows_when_full(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        population = DemePopulation(6, 1)
+        members = [GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1) for x in range(0, 3)]
+        for member in members:
+            population.insert(member)
+
+        self.assertEqual(4, population.capacity)
+        self.assertEqual([member.currentLocation.tolist() for member in members],
+                         [population.boards[member.slot].tolist() for member in members])
+
+    def test_replace_keeps_slot_and_free_slots(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        population = DemePopulation(6, 2)
+        first = GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1)
+        first.evaluate(NQueensEvaluation())
+        slot = population.insert(first)
+        replacement = GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1)
+
+        self.assertEqual(slot, population.replace(slot, replacement))
+        self.assertIs(replacement, population.members[slot])
+        self.assertIsNone(first.population)
+        self.assertEqual(9999999999, population.best_fitness[slot])
+        self.assertEqual(1, len(population))
+
+    def test_member_built_outside_a_deme_keeps_detached_rows(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        member = GeneticMember(parameters, [1, 3, 5, 0, 2, 4], 1)
+        member.evaluate(NQueensEvaluation())
+        detached = member.population
+
+        self.assertIsInstance(detached, DetachedRows)
+        self.assertEqual(0, member.slot)
+
+        population = DemePopulation(6, 2)
+        slot = population.insert(member)
+
+        self.assertIs(population, member.population)
+        self.assertEqual(detached.boards[0].tolist(), population.boards[slot].tolist())
+        self.assertEqual(detached.best_fitness[0], population.best_fitness[slot])
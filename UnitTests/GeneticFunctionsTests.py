@@ -0,0 +1,81 @@
+import random
+import unittest
+
+from Framework.Genetics import GeneticFunctions
+
+
+class GeneticFunctionsTests(unittest.TestCase):
+
+    def test_tracked_switch_keeps_hash_in_step_with_location(self):
+        random.seed(11)
+        location = [x for x in range(0, 16)]
+        location_hash = GeneticFunctions.hash_location(location)
+
+        for x in range(0, 50):
+            location, swaps, location_hash = GeneticFunctions.switch_positions_tracked(location, 3, location_hash)
+            self.assertEqual(GeneticFunctions.hash_location(location), location_hash)
+
+    def test_swapped_location_has_different_hash(self):
+        location = [0, 1, 2, 3]
+        swapped = GeneticFunctions.swap_positions(location, 1, 3)
+
+        self.assertEqual([0, 3, 2, 1], swapped)
+        self.assertNotEqual(GeneticFunctions.hash_location(location), GeneticFunctions.hash_location(swapped))
+
+    def test_switch_positions_does_not_change_the_parent(self):
+        location = [0, 1, 2, 3, 4, 5]
+
+        switched = GeneticFunctions.switch_positions(location, 4)
+
+        self.assertEqual([0, 1, 2, 3, 4, 5], location)
+        self.assertEqual(sorted(switched), location)
+        self.assertIsNot(location, GeneticFunctions.switch_positions(location, 0))
+
+    def test_create_mutants_returns_one_permutation_per_row(self):
+        location = [3, 1, 4, 0, 2, 5]
+
+        mutants = GeneticFunctions.create_mutants(location, 10, 2)
+
+        self.assertEqual((10, 6), mutants.shape)
+        for mutant in mutants.tolist():
+            self.assertEqual([0, 1, 2, 3, 4, 5], sorted(mutant))
+            self.assertLessEqual(sum(1 for x in range(0, 6) if mutant[x] != location[x]), 4)
+
+    def test_permutation_crossovers_keep_every_row_once(self):
+        random.seed(4)
+        operators = [GeneticFunctions.create_pmx_crossover,
+                     GeneticFunctions.create_order_crossover,
+                     GeneticFunctions.create_cycle_crossover]
+        for x in range(0, 30):
+            loc_one = [v for v in range(0, 10)]
+            loc_two = [v for v in range(0, 10)]
+            random.shuffle(loc_one)
+            random.shuffle(loc_two)
+
+            for operator in operators:
+                child = operator(loc_one, loc_two)
+                self.assertEqual([v for v in range(0, 10)], sorted(child))
+
+    def test_cycle_crossover_takes_each_position_from_a_parent(self):
+        loc_one = [0, 1, 2, 3, 4, 5, 6, 7]
+        loc_two = [1, 0, 3, 2, 5, 4, 7, 6]
+
+        child = GeneticFunctions.create_cycle_crossover(loc_one, loc_two)
+
+        self.assertEqual([0, 1, 3, 2, 4, 5, 7, 6], child)
+
+    def test_random_location_is_a_permutation(self):
+        location = GeneticFunctions.create_random_location(12)
+
+        self.assertEqual([x for x in range(0, 12)], sorted(location))
+
+    def test_random_locations_are_repeatable_for_a_seed(self):
+        GeneticFunctions.seed_random_streams(21)
+        first = GeneticFunctions.create_random_locations(8, 5)
+        GeneticFunctions.seed_random_streams(21)
+        second = GeneticFunctions.create_random_locations(8, 5)
+        GeneticFunctions.seed_random_streams(None)
+
+        self.assertEqual(first.tolist(), second.tolist())
+        for location in first.tolist():
+            self.assertEqual([x for x in range(0, 8)], sorted(location))
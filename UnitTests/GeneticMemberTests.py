@@ -0,0 +1,82 @@
+import unittest
+
+from Framework.Configuration.RunParameters import RunParameters
+from Framework.MemberFactories.GeneticMemberFactory import GeneticMemberFactory
+from Framework.Members.GeneticMember import GeneticMember
+from NQueens.NQueensEvaluation import NQueensEvaluation
+
+
+class GeneticMemberTests(unittest.TestCase):
+
+    def test_member_is_clean_after_evaluation_until_updated(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        member = GeneticMember(parameters, [0, 1, 2, 3, 4, 5], 1)
+        self.assertEqual(True, member.dirty)
+
+        member.evaluate(NQueensEvaluation())
+        self.assertEqual(False, member.dirty)
+
+        member.update()
+        self.assertEqual(True, member.dirty)
+
+    def test_restricted_member_keeps_first_queen_in_top_half(self):
+        parameters = RunParameters(7, [7, 7, 7, 7, 7, 7, 7])
+        parameters.restrict_symmetry = True
+        evaluation = NQueensEvaluation(incremental=True)
+        member = GeneticMember(parameters, [6, 5, 4, 3, 2, 1, 0], 2)
+
+        for x in range(0, 200):
+            self.assertLessEqual(member.currentLocation[0], 3)
+            result = member.evaluate(evaluation)
+            self.assertEqual(NQueensEvaluation().countNumberOfAttackingQueens(member.currentLocation.tolist()), result)
+            member.update()
+
+    def test_recycled_member_is_reinitialised_in_place(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        factory = GeneticMemberFactory(parameters)
+        member = factory.build([0, 1, 2, 3, 4, 5], None)
+        member.evaluate(NQueensEvaluation())
+        member.update()
+
+        recycled = factory.build([1, 3, 5, 0, 2, 4], None, member)
+
+        self.assertIs(member, recycled)
+        self.assertEqual(0, recycled.age)
+        self.assertEqual(9999999999, recycled.bestPerformance)
+        self.assertEqual(True, recycled.dirty)
+        self.assertEqual(sorted(recycled.currentLocation.tolist()), [0, 1, 2, 3, 4, 5])
+
+    def test_members_do_not_carry_an_instance_dictionary(self):
+        parameters = RunParameters(6, [6, 6, 6, 6, 6, 6])
+        member = GeneticMember(parameters, [0, 1, 2, 3, 4, 5], 1)
+
+        self.assertEqual(False, hasattr(member, '__dict__'))
+
+    def test_update_moves_through_an_overridden_select_location(self):
+        class AlternatingMember(GeneticMember):
+
+            def selectLocation(self, demeLocation):
+                if list(demeLocation) != [0, 1, 2, 3, 4]:
+                    return [0, 1, 2, 3, 4]
+                return [1, 0, 2, 3, 4]
+
+        evaluation = NQueensEvaluation(incremental=True)
+        member = AlternatingMember(RunParameters(5, [5, 5, 5, 5, 5]), [1, 0, 2, 3, 4], 1)
+        before = list(member.currentLocation)
+        self.assertEqual(evaluation.countNumberOfAttackingQueens(before), member.evaluate(evaluation))
+
+        member.update()
+
+        after = AlternatingMember.selectLocation(member, before)
+        self.assertEqual(after, list(member.currentLocation))
+        self.assertEqual(evaluation.countNumberOfAttackingQueens(after), member.evaluate(evaluation))
+
+    def test_members_without_a_board_state_do_not_queue_swaps(self):
+        evaluation = NQueensEvaluation()
+        member = GeneticMember(RunParameters(6, [6, 6, 6, 6, 6, 6]), [1, 3, 5, 0, 2, 4], 2)
+
+        for x in range(0, 5):
+            member.evaluate(evaluation)
+            member.update()
+
+        self.assertEqual([], member.pendingSwaps)
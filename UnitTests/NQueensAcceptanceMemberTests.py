@@ -0,0 +1,49 @@
+import random
+import unittest
+
+from Framework.Configuration.RunParameters import RunParameters
+from Framework.Genetics import GeneticFunctions
+from Framework.SolutionSinks.NullSolutionSink import NullSolutionSink
+from NQueens.Members.NQueensAnnealingMember import NQueensAnnealingMember
+from NQueens.Members.NQueensTabuMember import NQueensTabuMember
+from NQueens.NQueensEvaluation import NQueensEvaluation
+
+
+class NQueensAcceptanceMemberTests(unittest.TestCase):
+
+    def create_parameters(self):
+        parameters = RunParameters(8, [8, 8, 8, 8, 8, 8, 8, 8])
+        parameters.initial_temperature = 0.000001
+        parameters.cooling_rate = 0.5
+        parameters.tabu_size = 8
+        return parameters
+
+    def test_cold_annealing_member_never_keeps_a_worse_location(self):
+        random.seed(6)
+        for incremental, restrict_symmetry in [(False, False), (True, False), (True, True)]:
+            parameters = self.create_parameters()
+            parameters.restrict_symmetry = restrict_symmetry
+            evaluation = NQueensEvaluation(incremental=incremental, solution_sink=NullSolutionSink())
+            member = NQueensAnnealingMember(parameters, [0, 4, 7, 5, 2, 6, 1, 3], 1)
+
+            for x in range(0, 100):
+                result = member.evaluate(evaluation)
+                self.assertGreaterEqual(result, member.acceptedPerformance)
+                self.assertEqual(member.acceptedPerformance, evaluation.countNumberOfAttackingQueens(member.currentLocation.tolist()))
+                self.assertEqual(GeneticFunctions.hash_location(member.currentLocation.tolist()), member.currentHash)
+                if member.boardState is not None:
+                    self.assertEqual(member.currentLocation.tolist(), member.boardState.get_location())
+                member.update()
+
+    def test_tabu_member_does_not_repeat_recent_swaps(self):
+        random.seed(6)
+        parameters = self.create_parameters()
+        parameters.restrict_symmetry = True
+        evaluation = NQueensEvaluation(incremental=True, solution_sink=NullSolutionSink())
+        member = NQueensTabuMember(parameters, [0, 1, 2, 3, 4, 5, 6, 7], 1)
+
+        for x in range(0, 50):
+            member.evaluate(evaluation)
+            tabu = set(member.tabu)
+            member.update()
+            self.assertEqual(False, member.lastSwaps[0] in tabu)
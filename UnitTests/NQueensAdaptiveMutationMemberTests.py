@@ -0,0 +1,28 @@
+import unittest
+
+from Framework.Configuration.RunParameters import RunParameters
+from NQueens.Members.NQueensAdaptiveMutationMember import NQueensAdaptiveMutationMember
+
+
+class NQueensAdaptiveMutationMemberTests(unittest.TestCase):
+
+    def create_member(self, mutation_count):
+        parameters = RunParameters(10, [10 for x in range(0, 10)])
+        parameters.adaptation_window = 5
+        return NQueensAdaptiveMutationMember(parameters, [x for x in range(0, 10)], mutation_count)
+
+    def test_failed_mutations_reduce_strength(self):
+        member = self.create_member(8)
+
+        for x in range(0, 30):
+            member.applyResult(20)
+
+        self.assertEqual(3, member.mutationCount)
+
+    def test_successful_mutations_increase_strength(self):
+        member = self.create_member(2)
+
+        for x in range(0, 11):
+            member.applyResult(40 - x)
+
+        self.assertEqual(3, member.mutationCount)
@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from NQueens.NQueensBoardState import NQueensBoardState
+from NQueens.NQueensEvaluation import NQueensEvaluation
+
+
+class NQueensBoardStateTests(unittest.TestCase):
+
+    def test_initial_count_matches_full_evaluation(self):
+        evaluation = NQueensEvaluation()
+        board = [3, 1, 1, 2, 0]
+        state = NQueensBoardState(board)
+
+        self.assertEqual(evaluation.countNumberOfAttackingQueens(board), state.attacking_count)
+
+    def test_initial_count_matches_placing_queens_one_by_one(self):
+        random.seed(4)
+        for x in range(0, 30):
+            board = [random.randint(0, 9) for v in range(0, 10)]
+            state = NQueensBoardState(board)
+            placed = NQueensBoardState([])
+            placed.dimensions = len(board)
+            placed.rows = [0 for v in range(0, len(board))]
+            placed.diagonals = [0 for v in range(0, (2 * len(board)) - 1)]
+            placed.anti_diagonals = [0 for v in range(0, (2 * len(board)) - 1)]
+            for column in range(0, len(board)):
+                placed.place(column, board[column])
+
+            self.assertEqual(placed.attacking_count, state.attacking_count)
+            self.assertEqual(placed.rows, state.rows)
+            self.assertEqual(placed.diagonals, state.diagonals)
+            self.assertEqual(placed.anti_diagonals, state.anti_diagonals)
+
+    def test_solution_has_no_attacking_queens(self):
+        state = NQueensBoardState([1, 3, 0, 2])
+
+        self.assertEqual(0, state.attacking_count)
+
+    def test_swaps_match_full_evaluation(self):
+        evaluation = NQueensEvaluation()
+        random.seed(5)
+        board = [x for x in range(0, 12)]
+        random.shuffle(board)
+        state = NQueensBoardState(board)
+
+        for x in range(0, 200):
+            first = random.randint(0, 10)
+            last = random.randint(first + 1, 11)
+            result = state.swap(first, last)
+            board[first], board[last] = board[last], board[first]
+            self.assertEqual(evaluation.countNumberOfAttackingQueens(board), result)
+            self.assertEqual(board, state.get_location())
+
+    def test_conflicting_columns_match_evaluation_profile(self):
+        random.seed(9)
+        for x in range(0, 20):
+            board = [random.randint(0, 7) for v in range(0, 8)]
+            state = NQueensBoardState(board)
+
+            self.assertEqual(NQueensEvaluation.countConflictProfile(board), (state.attacking_count, state.conflicting_columns()))
@@ -0,0 +1,36 @@
+import itertools
+import random
+import unittest
+
+from Framework.Configuration.RunParameters import RunParameters
+from NQueens.NQueensBoardState import NQueensBoardState
+from NQueens.NQueensCompositionLocationBuilder import NQueensCompositionLocationBuilder
+
+
+class NQueensCompositionLocationBuilderTests(unittest.TestCase):
+
+    @staticmethod
+    def find_solutions(dimensions):
+        return [list(p) for p in itertools.permutations(range(0, dimensions))
+                if NQueensBoardState(p).attacking_count == 0]
+
+    def test_toroidal_inner_solutions_give_valid_compositions(self):
+        parameters = RunParameters(40, [40 for x in range(0, 40)])
+        builder = NQueensCompositionLocationBuilder(parameters, self.find_solutions(8), self.find_solutions(5))
+
+        compositions = [c for c in builder.create_compositions()]
+
+        self.assertEqual(92 * 10, len(compositions))
+        self.assertEqual(len(compositions), len(set(tuple(c) for c in compositions)))
+        for composition in compositions:
+            self.assertEqual(0, NQueensBoardState(composition).attacking_count)
+
+    def test_non_toroidal_inner_solutions_are_repaired(self):
+        random.seed(6)
+        parameters = RunParameters(24, [24 for x in range(0, 24)])
+        builder = NQueensCompositionLocationBuilder(parameters, self.find_solutions(4), self.find_solutions(6))
+
+        location = builder.build(None)
+
+        self.assertEqual(1, builder.repairs)
+        self.assertEqual(0, NQueensBoardState(location).attacking_count)
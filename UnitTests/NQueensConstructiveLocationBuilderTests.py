@@ -0,0 +1,50 @@
+import random
+import unittest
+
+from Framework.Configuration.RunParameters import RunParameters
+from NQueens.NQueensConstructiveLocationBuilder import NQueensConstructiveLocationBuilder
+from NQueens.NQueensEvaluation import NQueensEvaluation
+
+
+class NQueensConstructiveLocationBuilderTests(unittest.TestCase):
+
+    def test_explicit_construction_solves_every_dimension(self):
+        evaluation = NQueensEvaluation()
+        for dimensions in range(4, 80):
+            location = NQueensConstructiveLocationBuilder.create_explicit_location(dimensions)
+
+            self.assertEqual(0, evaluation.countNumberOfAttackingQueens(location))
+
+    def test_built_locations_are_solutions(self):
+        evaluation = NQueensEvaluation()
+        for dimensions in [8, 9, 11, 12, 13, 25, 32, 33]:
+            parameters = RunParameters(dimensions, [dimensions for x in range(0, dimensions)])
+            builder = NQueensConstructiveLocationBuilder(parameters)
+
+            for x in range(0, 5):
+                self.assertEqual(0, evaluation.countNumberOfAttackingQueens(builder.build(None)))
+
+    def test_dimensions_without_multipliers_build_more_than_the_symmetries(self):
+        evaluation = NQueensEvaluation()
+        parameters = RunParameters(12, [12 for x in range(0, 12)])
+        builder = NQueensConstructiveLocationBuilder(parameters)
+
+        locations = [builder.build(None) for x in range(0, 50)]
+
+        self.assertEqual([], builder.multipliers)
+        self.assertTrue(all(evaluation.countNumberOfAttackingQueens(location) == 0 for location in locations))
+        self.assertGreater(len(set(tuple(location) for location in locations)), 8)
+
+    def test_dimensions_two_or_three_mod_six_build_more_than_the_symmetries(self):
+        random.seed(5)
+        evaluation = NQueensEvaluation()
+        for dimensions in [32, 33]:
+            parameters = RunParameters(dimensions, [dimensions for x in range(0, dimensions)])
+            builder = NQueensConstructiveLocationBuilder(parameters)
+
+            locations = [builder.build(None) for x in range(0, 50)]
+
+            self.assertEqual([], builder.multipliers)
+            self.assertEqual([], builder.corner_multipliers)
+            self.assertTrue(all(evaluation.countNumberOfAttackingQueens(location) == 0 for location in locations))
+            self.assertGreater(len(set(tuple(location) for location in locations)), 8)
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from NQueens.NQueensEvaluation import NQueensEvaluation
@@ -34,4 +35,92 @@ class NQueensEvaluationTests(unittest.TestCase):
         self.assertEqual(rotated[1], 0)
         self.assertEqual(rotated[2], 3)
         self.assertEqual(rotated[3], 1)
-        self.assertEqual(rotated[4], 4)
\ No newline at end of file
+        self.assertEqual(rotated[4], 4)
+
+    def test_incremental_evaluation_matches_full_evaluation(self):
+        evaluation = NQueensEvaluation(incremental=True)
+        board = [0, 1, 2, 3, 4, 5, 6, 7]
+        state = evaluation.create_board_state(board)
+
+        result = evaluation.evaluate_swaps(state, [(1, 3), (0, 6), (2, 7)])
+
+        self.assertEqual(NQueensEvaluation().countNumberOfAttackingQueens(state.get_location()), result)
+        self.assertEqual(1, evaluation.evaluations)
+
+    def test_batch_evaluation_matches_full_evaluation(self):
+        evaluation = NQueensEvaluation(batch=True)
+        boards = [[3, 1, 4, 2, 0], [0, 1, 2, 3, 4], [1, 1, 4, 2, 2], [1, 3, 0, 2, 4]]
+
+        results = evaluation.evaluate_batch(boards)
+
+        for index in range(0, len(boards)):
+            self.assertEqual(NQueensEvaluation().countNumberOfAttackingQueens(boards[index]), results[index])
+        self.assertEqual(1, evaluation.fundamental_solutions)
+
+    def test_symmetric_solutions_share_a_canonical_key(self):
+        evaluation = NQueensEvaluation()
+        evaluation.evaluate([1, 3, 0, 2])
+        evaluation.evaluate([2, 0, 3, 1])
+
+        self.assertEqual(1, len(evaluation.resultStore))
+        self.assertEqual(1, evaluation.fundamental_solutions)
+        self.assertEqual(2, evaluation.total_solutions)
+        self.assertEqual(2, evaluation.evaluations)
+
+    def test_all_solutions_expands_symmetries(self):
+        evaluation = NQueensEvaluation()
+        evaluation.evaluate([1, 3, 0, 2, 4])
+
+        solutions = [s for s in evaluation.all_solutions()]
+
+        self.assertEqual(evaluation.total_solutions, len(solutions))
+        for solution in solutions:
+            self.assertEqual(0, NQueensEvaluation().countNumberOfAttackingQueens(solution))
+
+    def test_cached_boards_are_counted_as_duplicates(self):
+        evaluation = NQueensEvaluation(cache_size=2)
+        evaluation.evaluate([0, 1, 2, 3])
+        evaluation.evaluate([0, 1, 2, 3])
+        evaluation.evaluate([3, 1, 2, 0])
+        evaluation.evaluate([0, 2, 1, 3])
+
+        result = evaluation.evaluate([0, 1, 2, 3])
+
+        self.assertEqual(NQueensEvaluation().countNumberOfAttackingQueens([0, 1, 2, 3]), result)
+        self.assertEqual(4, evaluation.evaluations)
+        self.assertEqual(1, evaluation.duplicates)
+        self.assertEqual(2, len(evaluation.fails))
+
+    def test_permutation_diagonals_match_pairwise_count(self):
+        evaluation = NQueensEvaluation()
+        random.seed(3)
+        for x in range(0, 50):
+            board = [v for v in range(0, 9)]
+            random.shuffle(board)
+
+            self.assertEqual(evaluation.countAttackingDiagonals(board, 9), evaluation.countPermutationDiagonals(board, 9))
+
+    def test_repeated_rows_use_pairwise_count(self):
+        evaluation = NQueensEvaluation()
+        board = [0, 2, 2, 4, 1]
+
+        result = evaluation.countNumberOfAttackingQueens(board)
+
+        self.assertEqual(1 + evaluation.countAttackingDiagonals(board, 5), result)
+
+    def test_batch_profiles_match_the_conflict_profile(self):
+        evaluation = NQueensEvaluation()
+        boards = [[1, 3, 0, 2, 2], [0, 1, 2, 3, 4], [1, 3, 0, 2, 4], [4, 4, 4, 4, 4]]
+
+        profiles = evaluation.profile_batch(boards)
+
+        self.assertEqual([NQueensEvaluation.countConflictProfile(board)[1] for board in boards], profiles)
+
+    def test_conflict_profile_lists_attacked_columns(self):
+        evaluation = NQueensEvaluation()
+        board = [1, 3, 0, 2, 2]
+
+        result, conflicts = evaluation.evaluate_profile(board)
+
+        self.assertEqual(NQueensEvaluation().countNumberOfAttackingQueens(board), result)
+        self.assertEqual([2, 3, 4], conflicts)
@@ -0,0 +1,25 @@
+import unittest
+
+from NQueens.NQueensFitnessCache import NQueensFitnessCache
+
+
+class NQueensFitnessCacheTests(unittest.TestCase):
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = NQueensFitnessCache(2)
+        cache.put(b'a', 1)
+        cache.put(b'b', 2)
+        cache.get(b'a')
+        cache.put(b'c', 3)
+
+        self.assertEqual(1, cache.get(b'a'))
+        self.assertEqual(None, cache.get(b'b'))
+        self.assertEqual(2, len(cache))
+
+    def test_zero_results_are_cache_hits(self):
+        cache = NQueensFitnessCache(1)
+        cache.put(b'a', 0)
+
+        self.assertEqual(0, cache.get(b'a'))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(0, cache.misses)
@@ -0,0 +1,44 @@
+import random
+import unittest
+
+from Framework.SolutionSinks.NullSolutionSink import NullSolutionSink
+from NQueens.MemberFactories.NQueensGuidedMutationMemberFactory import NQueensGuidedMutationMemberFactory
+from NQueens.NQueensEvaluation import NQueensEvaluation
+from NQueens.NQueensRunController import NQueensRunController
+from NQueens.NQueensRunParameters import NQueensRunParameters
+
+
+class NQueensGuidedMutationMemberTests(unittest.TestCase):
+
+    def create_guided_deme(self):
+        random.seed(4)
+        parameters = NQueensRunParameters(8, [8] * 8, 12, 3, [35, 70, 110], 3, 3, 7, False)
+        parameters.total_demes = 1
+        deme = NQueensRunController(parameters).demes[0]
+        factory = NQueensGuidedMutationMemberFactory(parameters)
+        for slot in deme.population.occupied_slots():
+            deme.build_member(factory, deme.bestLocation, slot).update()
+
+        return deme
+
+    def test_batch_evaluation_gives_guided_members_their_conflicts(self):
+        deme = self.create_guided_deme()
+
+        deme.evaluate(NQueensEvaluation(batch=True, solution_sink=NullSolutionSink()))
+
+        for member in deme.members:
+            result, conflicts = NQueensEvaluation.countConflictProfile(member.currentLocation.tolist())
+            self.assertEqual(result, member.bestPerformance)
+            self.assertEqual(conflicts, member.conflicts)
+
+    def test_guided_members_use_the_fitness_cache(self):
+        member = self.create_guided_deme().members[0]
+        evaluation = NQueensEvaluation(cache_size=16, solution_sink=NullSolutionSink())
+
+        first = member.evaluate(evaluation)
+        second = member.evaluate(evaluation)
+
+        self.assertEqual(first, second)
+        self.assertEqual(1, evaluation.evaluations)
+        self.assertEqual(1, evaluation.duplicates)
+        self.assertIsNone(member.conflicts)
@@ -0,0 +1,78 @@
+import random
+import unittest
+
+from Framework.Configuration.RunParameters import RunParameters
+from Framework.Genetics import GeneticFunctions
+from NQueens.NQueensEvaluation import NQueensEvaluation
+from NQueens.NQueensMigrator import NQueensMigrator
+from NQueens.NQueensRunController import NQueensRunController
+from NQueens.NQueensRunParameters import NQueensRunParameters
+
+
+class NQueensMigratorTests(unittest.TestCase):
+
+    def create_parameters(self, topology):
+        parameters = RunParameters(8, [8] * 8)
+        parameters.migration_interval = 5
+        parameters.migration_rate = 2
+        parameters.migration_topology = topology
+        return parameters
+
+    def test_migration_runs_on_the_interval(self):
+        migrator = NQueensMigrator(self.create_parameters('ring'))
+
+        self.assertEqual([5, 10], [iteration for iteration in range(1, 12) if migrator.should_migrate(iteration)])
+
+    def test_ring_sends_each_deme_to_the_next(self):
+        demes = ['a', 'b', 'c']
+
+        self.assertEqual([('a', 'b'), ('b', 'c'), ('c', 'a')], NQueensMigrator.create_ring_routes(demes))
+
+    def test_random_routes_never_target_the_source(self):
+        random.seed(2)
+        demes = ['a', 'b', 'c', 'd']
+
+        for x in range(0, 20):
+            for source, target in NQueensMigrator.create_random_routes(demes):
+                self.assertNotEqual(source, target)
+
+    def test_migrants_replace_the_worst_members_of_the_weakest_tournaments(self):
+        random.seed(5)
+        parameters = NQueensRunParameters(8, [8] * 8, 50, 3, [35, 70, 110], 5, 3, 7, False)
+        parameters.total_demes = 2
+        parameters.migration_rate = 2
+        controller = NQueensRunController(parameters)
+        evaluation = NQueensEvaluation()
+        for deme in controller.demes:
+            deme.evaluate(evaluation)
+
+        target = controller.demes[1]
+        worst = target.get_worstTournamentSlots(2)
+        tournaments = [next(tournament for tournament in target.member_pairs if slot in tournament) for slot in worst]
+        best_fitness = target.population.best_fitness
+        self.assertEqual(2, len(set(id(tournament) for tournament in tournaments)))
+        for slot, tournament in zip(worst, tournaments):
+            self.assertEqual(max(best_fitness[other] for other in tournament), best_fitness[slot])
+        migrants = controller.demes[0].get_eliteLocations(2)
+        controller.migrator.migrate(controller.demes)
+
+        self.assertEqual(4, controller.migrator.migrations)
+        self.assertEqual(migrants, [target.population.members[slot].currentLocation.tolist() for slot in worst])
+        for slot in worst:
+            member = target.population.members[slot]
+            self.assertEqual(True, member.dirty)
+            self.assertEqual(9999999999, member.bestPerformance)
+            self.assertEqual(member.currentLocation.tolist(), member.bestLocation.tolist())
+            self.assertEqual(GeneticFunctions.hash_location(member.currentLocation.tolist()), member.currentHash)
+
+    def test_solved_members_are_not_sent_as_migrants(self):
+        random.seed(5)
+        parameters = NQueensRunParameters(8, [8] * 8, 50, 3, [35, 70, 110], 5, 3, 7, False)
+        parameters.total_demes = 1
+        deme = NQueensRunController(parameters).demes[0]
+        deme.evaluate(NQueensEvaluation())
+        slots = deme.population.occupied_slots()
+        deme.population.best_fitness[slots[0]] = 0
+        deme.population.best_fitness[slots[1]] = 1
+
+        self.assertEqual([deme.population.best_boards[slots[1]].tolist()], deme.get_eliteLocations(1))
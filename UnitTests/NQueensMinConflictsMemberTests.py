@@ -0,0 +1,27 @@
+import random
+import unittest
+
+from Framework.Configuration.RunParameters import RunParameters
+from Framework.Genetics import GeneticFunctions
+from Framework.SolutionSinks.NullSolutionSink import NullSolutionSink
+from NQueens.Members.NQueensMinConflictsMember import NQueensMinConflictsMember
+from NQueens.NQueensEvaluation import NQueensEvaluation
+
+
+class NQueensMinConflictsMemberTests(unittest.TestCase):
+
+    def test_min_conflicts_member_solves_a_large_board(self):
+        random.seed(2)
+        dimensions = 100
+        parameters = RunParameters(dimensions, [dimensions for x in range(0, dimensions)])
+        evaluation = NQueensEvaluation(solution_sink=NullSolutionSink())
+        member = NQueensMinConflictsMember(parameters, [x for x in range(0, dimensions)], 0)
+
+        for x in range(0, 2000):
+            if member.evaluate(evaluation) == 0:
+                break
+            member.update()
+
+        self.assertEqual(0, member.get_BestFitness())
+        self.assertEqual(0, evaluation.countNumberOfAttackingQueens(member.bestLocation.tolist()))
+        self.assertEqual(GeneticFunctions.hash_location(member.currentLocation.tolist()), member.currentHash)
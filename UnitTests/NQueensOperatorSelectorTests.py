@@ -0,0 +1,46 @@
+import random
+import unittest
+
+from NQueens.NQueensOperatorSelector import NQueensOperatorSelector
+
+
+class NQueensOperatorSelectorTests(unittest.TestCase):
+
+    def test_probabilities_start_uniform(self):
+        selector = NQueensOperatorSelector(['a', 'b', 'c', 'd'])
+
+        for name in selector.names:
+            self.assertAlmostEqual(0.25, selector.probabilities[name])
+
+    def test_credited_operator_is_pursued(self):
+        selector = NQueensOperatorSelector(['a', 'b', 'c', 'd'])
+        for x in range(0, 50):
+            selector.credit({'b': [2], 'a': [0]})
+
+        self.assertAlmostEqual(selector.max_probability, selector.probabilities['b'], places=5)
+        self.assertAlmostEqual(selector.min_probability, selector.probabilities['a'], places=5)
+        self.assertAlmostEqual(1.0, sum(selector.probabilities.values()))
+
+    def test_tied_qualities_leave_the_probabilities_alone(self):
+        selector = NQueensOperatorSelector(['a', 'b', 'c'])
+        selector.credit({'a': [1], 'b': [1]})
+
+        self.assertEqual(selector.qualities['a'], selector.qualities['b'])
+        for name in selector.names:
+            self.assertAlmostEqual(1.0 / 3, selector.probabilities[name])
+
+    def test_one_pursuit_step_per_credit_whatever_the_number_of_rewards(self):
+        selector = NQueensOperatorSelector(['a', 'b'])
+        selector.credit({'b': [2, 0, 1, 1]})
+
+        self.assertAlmostEqual(0.8, selector.qualities['b'])
+        self.assertEqual(4, selector.rewards['b'])
+        self.assertAlmostEqual(0.5 + 0.3 * (selector.max_probability - 0.5), selector.probabilities['b'])
+
+    def test_selection_follows_probabilities(self):
+        random.seed(1)
+        selector = NQueensOperatorSelector(['a', 'b'])
+        selector.probabilities = {'a': 0.0, 'b': 1.0}
+
+        self.assertEqual(['b'] * 10, [selector.select() for x in range(0, 10)])
+        self.assertEqual(10, selector.get_report()['b']['selections'])
@@ -0,0 +1,33 @@
+import unittest
+
+from NQueens.NQueensResultStore import NQueensResultStore, pack_board
+
+
+class NQueensResultStoreTests(unittest.TestCase):
+
+    def test_duplicate_boards_are_stored_once(self):
+        store = NQueensResultStore()
+
+        self.assertEqual(True, store.add([1, 3, 0, 2]))
+        self.assertEqual(False, store.add((1, 3, 0, 2)))
+        self.assertEqual(1, len(store))
+        self.assertEqual(True, [1, 3, 0, 2] in store)
+
+    def test_large_boards_use_two_bytes_per_column(self):
+        store = NQueensResultStore()
+        board = [x for x in range(0, 300)]
+
+        store.add(board)
+
+        self.assertEqual(600, len(pack_board(board)))
+        self.assertEqual([board], [b for b in store])
+
+    def test_memory_report_shows_packed_saving(self):
+        store = NQueensResultStore()
+        store.add([x for x in range(0, 32)])
+        store.add([x for x in range(31, -1, -1)])
+
+        report = store.memory_report()
+
+        self.assertEqual(2, report['entries'])
+        self.assertLess(report['packed_bytes'], report['string_key_bytes'])
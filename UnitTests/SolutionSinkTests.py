@@ -0,0 +1,92 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from Framework.SolutionSinks.BackgroundSolutionSink import BackgroundSolutionSink
+from Framework.SolutionSinks.BufferedFileSolutionSink import BufferedFileSolutionSink
+from Framework.SolutionSinks.NullSolutionSink import NullSolutionSink
+from Framework.SolutionSinks.SolutionRecord import SolutionRecord
+from Framework.SolutionSinks.SolutionSink import SolutionSink
+from NQueens.NQueensEvaluation import NQueensEvaluation
+
+
+class BlockingSolutionSink(SolutionSink):
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.records = []
+
+    def write(self, record):
+        self.started.set()
+        self.release.wait()
+        self.records.append(record)
+
+
+class FailingSolutionSink(SolutionSink):
+
+    def write(self, record):
+        raise IOError("disk full")
+
+
+class SolutionSinkTests(unittest.TestCase):
+
+    def test_buffered_file_sink_writes_on_close(self):
+        filename = os.path.join(tempfile.mkdtemp(), "solutions.txt")
+        sink = BufferedFileSolutionSink(filename, 10)
+        sink.write(SolutionRecord([1, 3, 0, 2], 7, 1))
+
+        with open(filename) as file:
+            self.assertEqual("", file.read())
+        sink.close()
+
+        with open(filename) as file:
+            self.assertEqual(True, file.read().startswith("1#3#0#2 ===== 1 ----------> 7"))
+
+    def test_background_sink_passes_records_to_target(self):
+        filename = os.path.join(tempfile.mkdtemp(), "solutions.txt")
+        sink = BackgroundSolutionSink(BufferedFileSolutionSink(filename))
+        for x in range(0, 20):
+            sink.write(SolutionRecord([1, 3, 0, 2], x, x))
+        sink.close()
+
+        self.assertEqual(0, sink.dropped)
+        with open(filename) as file:
+            self.assertEqual(20, len(file.readlines()))
+
+    def test_background_sink_drops_records_when_the_queue_is_full(self):
+        target = BlockingSolutionSink()
+        sink = BackgroundSolutionSink(target, 2)
+        sink.write(SolutionRecord([1, 3, 0, 2], 0, 0))
+        target.started.wait()
+        for x in range(1, 6):
+            sink.write(SolutionRecord([1, 3, 0, 2], x, x))
+        target.release.set()
+        sink.close()
+
+        self.assertEqual(3, sink.dropped)
+        self.assertEqual([0, 1, 2], [record.evaluations for record in target.records])
+
+    def test_background_sink_raises_writer_errors_on_flush(self):
+        sink = BackgroundSolutionSink(FailingSolutionSink())
+        sink.write(SolutionRecord([1, 3, 0, 2], 0, 0))
+        sink.write(SolutionRecord([1, 3, 0, 2], 1, 1))
+
+        self.assertRaises(IOError, sink.flush)
+        sink.close()
+
+    def test_evaluation_writes_new_solutions_to_sink(self):
+        filename = os.path.join(tempfile.mkdtemp(), "solutions.txt")
+        evaluation = NQueensEvaluation(solution_sink=BufferedFileSolutionSink(filename))
+        evaluation.evaluate([1, 3, 0, 2])
+        evaluation.evaluate([2, 0, 3, 1])
+        evaluation.solution_sink.close()
+
+        with open(filename) as file:
+            self.assertEqual(1, len(file.readlines()))
+
+    def test_null_sink_ignores_records(self):
+        evaluation = NQueensEvaluation(solution_sink=NullSolutionSink())
+
+        self.assertEqual(0, evaluation.evaluate([1, 3, 0, 2]))